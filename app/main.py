@@ -69,15 +69,18 @@ async def lifespan(app: FastAPI):
         logger.warning("App wird trotzdem gestartet (Migration manuell prüfen!)")
 
     # Prüfen ob Demo-Daten erstellt werden sollen (nur beim ersten Start)
-    from app.database import SessionLocal
+    from app.database import SessionLocal, transaction
     from app.models.event import Event
     db = SessionLocal()
     try:
-        event_count = db.query(Event).count()
-        if event_count == 0:
+        # Nur Existenz prüfen (SELECT EXISTS, statt COUNT über alle Events)
+        has_events = db.query(db.query(Event.id).exists()).scalar()
+        if not has_events:
             logger.info("Keine Events gefunden - erstelle Demo-Daten...")
             from app.utils.seed_helper import create_demo_data
-            create_demo_data(db)
+            # Alle Demo-Daten in einer Transaktion (ein Commit, bei Fehler komplett zurückgerollt)
+            with transaction(db):
+                create_demo_data(db)
             logger.info("Demo-Daten erfolgreich erstellt!")
     except Exception as e:
         logger.error(f"Fehler beim Erstellen der Demo-Daten: {e}")
@@ -1,6 +1,6 @@
 """Expense (Ausgabe) Model"""
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Numeric, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Numeric, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,6 +12,10 @@ class Expense(Base):
     Repräsentiert eine Ausgabe für die Freizeit (z.B. Material, Transport, Verpflegung)
     """
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Filter auf event_id + Liste nach Datum sortiert (expenses/list)
+        Index("ix_expenses_event_id_expense_date", "event_id", "expense_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
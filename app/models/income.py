@@ -1,5 +1,5 @@
 """Income Model für zusätzliche Einnahmen (z.B. Zuschüsse)"""
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Date, DateTime, Text
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Date, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from app.utils.datetime_utils import get_utc_timestamp
@@ -8,6 +8,10 @@ from app.utils.datetime_utils import get_utc_timestamp
 class Income(Base):
     """Model für Einnahmen wie Zuschüsse, Spenden, etc."""
     __tablename__ = "incomes"
+    __table_args__ = (
+        # Filter auf event_id + Liste nach Datum sortiert (incomes/list)
+        Index("ix_incomes_event_id_date", "event_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False, index=True)
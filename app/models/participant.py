@@ -1,6 +1,6 @@
 """Participant (Teilnehmer) Model"""
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Boolean, Numeric
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Boolean, Numeric, Index, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,6 +12,13 @@ class Participant(Base):
     Repräsentiert einen Teilnehmer an einer Freizeit
     """
     __tablename__ = "participants"
+    __table_args__ = (
+        # Partielle Indizes statt Einzel-Indizes auf den Status-Flags (siehe Migration 009_participants_partial_idx)
+        Index("ix_participants_active", "event_id",
+              sqlite_where=text("is_active = 1"), postgresql_where=text("is_active = true")),
+        Index("ix_participants_live", "event_id", "last_name",
+              sqlite_where=text("deleted_at IS NULL"), postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -39,9 +46,9 @@ class Participant(Base):
     discount_reason = Column(String(200), nullable=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False, index=True)  # Index für Filter
+    is_active = Column(Boolean, default=True, nullable=False)  # Filter über ix_participants_active
     registration_date = Column(Date, default=get_local_date, nullable=False)
-    deleted_at = Column(DateTime, nullable=True, index=True)  # Index für Soft-Delete Queries
+    deleted_at = Column(DateTime, nullable=True)  # Soft-Delete Queries über ix_participants_live
 
     # Foreign Keys
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False, index=True)
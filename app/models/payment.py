@@ -1,6 +1,6 @@
 """Payment (Zahlung) Model"""
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,6 +12,10 @@ class Payment(Base):
     Repräsentiert eine Zahlung von einem Teilnehmer oder einer Familie
     """
     __tablename__ = "payments"
+    __table_args__ = (
+        # Filter auf event_id + Liste nach Datum sortiert (payments/list)
+        Index("ix_payments_event_id_payment_date", "event_id", "payment_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(Numeric(10, 2), nullable=False)
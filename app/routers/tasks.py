@@ -147,8 +147,14 @@ async def list_tasks(request: Request, db: Session = Depends(get_db), event_id:
                     "amount": outstanding
                 })
 
-    # 7. Manuelle Preisanpassungen prüfen
-    participants_with_override = db.query(Participant).filter(
+    # 7. Manuelle Preisanpassungen prüfen (nur benötigte Spalten, keine ORM-Objekte)
+    participants_with_override = db.query(
+        Participant.id,
+        Participant.first_name,
+        Participant.last_name,
+        Participant.calculated_price,
+        Participant.manual_price_override
+    ).filter(
         Participant.event_id == event_id,
         Participant.manual_price_override.isnot(None),
         Participant.is_active == True
@@ -158,7 +164,7 @@ async def list_tasks(request: Request, db: Session = Depends(get_db), event_id:
         if not is_task_completed(completed_tasks, "manual_price_override", participant.id):
             tasks["manual_price_override"].append({
                 "id": participant.id,
-                "title": f"{participant.full_name}",
+                "title": f"{participant.first_name} {participant.last_name}",
                 "description": f"Manueller Preis: {participant.manual_price_override:.2f}€ (statt {participant.calculated_price:.2f}€)",
                 "link": f"/participants/{participant.id}",
                 "task_type": "manual_price_override"
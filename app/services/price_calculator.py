@@ -172,8 +172,9 @@ class PriceCalculator:
         from app.models.role import Role
         from app.models.participant import Participant
 
-        # Event laden
-        event = db.query(Event).filter(Event.id == event_id).first()
+        # Event laden (db.get nutzt die Identity Map, bei Schleifen über
+        # viele Teilnehmer wird das Event nur einmal abgefragt)
+        event = db.get(Event, event_id)
         if not event:
             logger.warning(f"Event {event_id} not found")
             return 0.0
@@ -210,7 +211,7 @@ class PriceCalculator:
         # Rolle-Name für Preisberechnung
         role_name = None
         if role_id:
-            role = db.query(Role).filter(Role.id == role_id).first()
+            role = db.get(Role, role_id)
             if role:
                 role_name = role.name.lower()
 
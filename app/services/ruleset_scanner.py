@@ -118,8 +118,8 @@ class RulesetScanner:
 
         directories = []
 
-        # 1. Projekt-eigenes rulesets/ Verzeichnis
-        project_rulesets = Path("rulesets")
+        # 1. Projekt-eigenes rulesets/ Verzeichnis (relativ zum Paket, nicht zum Arbeitsverzeichnis)
+        project_rulesets = settings.rulesets_dir
         if project_rulesets.exists():
             directories.append(project_rulesets)
 
@@ -1,8 +1,8 @@
 """Helper für das Erstellen von Demo-Daten beim ersten Start"""
 from datetime import date
-from pathlib import Path
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models import Event, Family, Participant, Role, Ruleset, Payment, Expense, Income, Setting
 from app.services.ruleset_parser import RulesetParser
 from app.services.price_calculator import PriceCalculator
@@ -26,6 +26,8 @@ def create_demo_data(db: Session) -> None:
     Note:
         - Wird nur beim ersten Start ausgeführt (wenn keine Events existieren)
         - Aufgerufen in app/main.py im lifespan startup
+        - Schreibt nur per flush(); Commit/Rollback übernimmt der Aufrufer
+          (eine Transaktion für alle Demo-Daten, siehe app.database.transaction)
         - Ruleset wird aus rulesets/default.json geladen
     """
     # 1. Event erstellen
@@ -40,8 +42,7 @@ def create_demo_data(db: Session) -> None:
         is_active=True
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    db.flush()  # event.id für die abhängigen Datensätze
 
     # 2. Einstellungen erstellen
     setting = Setting(
@@ -55,7 +56,6 @@ def create_demo_data(db: Session) -> None:
         invoice_footer_text="Vielen Dank für Ihre Teilnahme! Bei Fragen erreichen Sie uns unter info@jugendverband-beispielstadt.de"
     )
     db.add(setting)
-    db.commit()
 
     # 3. Rollen erstellen
     roles_data = [
@@ -72,12 +72,13 @@ def create_demo_data(db: Session) -> None:
             color=role_data["color"],
             event_id=event.id
         )
-        db.add(role)
         roles[role_data["name"]] = role
-    db.commit()
+    db.add_all(roles.values())
 
     # 4. Regelwerk importieren
-    yaml_file = Path("rulesets/examples/familie_rabatt_2024.yaml")
+    # Relativ zum Paket, nicht zum Arbeitsverzeichnis (Onefile-Build wechselt
+    # dort in den Ordner der .exe, die Regelwerke liegen im Entpack-Ordner)
+    yaml_file = settings.rulesets_dir / "examples" / "familie_rabatt_2024.yaml"
     if yaml_file.exists():
         try:
             parser = RulesetParser()
@@ -91,12 +92,15 @@ def create_demo_data(db: Session) -> None:
                 age_groups=data["age_groups"],
                 role_discounts=data.get("role_discounts"),
                 family_discount=data.get("family_discount"),
-                source_file=str(yaml_file),
+                source_file=yaml_file.relative_to(settings.base_dir).as_posix(),
                 event_id=event.id,
                 is_active=True
             )
-            db.add(ruleset)
-            db.commit()
+            # Savepoint: ein fehlerhafter Regelwerk-Datensatz wird hier (nicht erst
+            # beim nächsten flush) erkannt und zurückgerollt, der Rest läuft weiter
+            with db.begin_nested():
+                db.add(ruleset)
+                db.flush()
         except Exception:
             # Falls Regelwerk-Import fehlschlägt, trotzdem fortfahren
             pass
@@ -111,7 +115,6 @@ def create_demo_data(db: Session) -> None:
         event_id=event.id
     )
     db.add(family_mueller)
-    db.commit()
 
     participants_mueller = [
         Participant(
@@ -129,9 +132,7 @@ def create_demo_data(db: Session) -> None:
             event=event
         )
     ]
-    for p in participants_mueller:
-        db.add(p)
-    db.commit()
+    db.add_all(participants_mueller)
 
     # Familie Schmidt
     family_schmidt = Family(
@@ -142,7 +143,6 @@ def create_demo_data(db: Session) -> None:
         event_id=event.id
     )
     db.add(family_schmidt)
-    db.commit()
 
     participant_schmidt = Participant(
         first_name="Tom",
@@ -152,7 +152,6 @@ def create_demo_data(db: Session) -> None:
         event=event
     )
     db.add(participant_schmidt)
-    db.commit()
 
     # Familie Weber (mit verschiedenen Altersgruppen für bessere Charts)
     family_weber = Family(
@@ -163,7 +162,6 @@ def create_demo_data(db: Session) -> None:
         event_id=event.id
     )
     db.add(family_weber)
-    db.commit()
 
     participants_weber = [
         Participant(
@@ -188,9 +186,7 @@ def create_demo_data(db: Session) -> None:
             event=event
         )
     ]
-    for p in participants_weber:
-        db.add(p)
-    db.commit()
+    db.add_all(participants_weber)
 
     # Einzelpersonen - verschiedene Rollen
     einzelpersonen = [
@@ -230,9 +226,8 @@ def create_demo_data(db: Session) -> None:
             event=event
         )
     ]
-    for ep in einzelpersonen:
-        db.add(ep)
-    db.commit()
+    db.add_all(einzelpersonen)
+    db.flush()  # IDs der Familien und Teilnehmer für die Zahlungen
 
     # 6. Beispiel-Zahlungen (über verschiedene Zeiträume für Timeline-Chart)
     payments = [
@@ -305,9 +300,7 @@ def create_demo_data(db: Session) -> None:
             event_id=event.id
         )
     ]
-    for payment in payments:
-        db.add(payment)
-    db.commit()
+    db.add_all(payments)
 
     # 7. Beispiel-Ausgaben
     expenses = [
@@ -362,9 +355,7 @@ def create_demo_data(db: Session) -> None:
             event_id=event.id
         )
     ]
-    for expense in expenses:
-        db.add(expense)
-    db.commit()
+    db.add_all(expenses)
 
     # 8. Beispiel-Einnahmen
     incomes = [
@@ -384,9 +375,8 @@ def create_demo_data(db: Session) -> None:
             event_id=event.id
         )
     ]
-    for income in incomes:
-        db.add(income)
-    db.commit()
+    db.add_all(incomes)
+    db.flush()  # Session ohne Autoflush: vor der Preisberechnung alles schreiben
 
     # 9. Preise für alle Teilnehmer neu berechnen (basierend auf Regelwerk)
     # Lade alle Teilnehmer des Events
@@ -416,5 +406,4 @@ def create_demo_data(db: Session) -> None:
             print(f"⚠️  Warnung: Preisberechnung für {participant.full_name} fehlgeschlagen: {e}")
             pass
 
-    db.commit()
     print(f"✅ {recalculated_count} Teilnehmerpreise automatisch berechnet")
\ No newline at end of file
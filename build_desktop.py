@@ -3,7 +3,13 @@ Build-Skript für MGBFreizeitplaner Desktop-Anwendung mit Nuitka
 
 Erstellt eine standalone .exe für Windows durch Kompilierung zu C.
 Nuitka bietet bessere Performance und Code-Schutz als PyInstaller.
+
+Optionen:
+    --clean, -c   Vollständige Bereinigung inkl. Nuitka-Cache
+    --debug, -d   Konsole bleibt sichtbar
+    --onefile     Einzelne .exe statt dist/desktop_app.dist/ Ordner
 """
+import hashlib
 import subprocess
 import sys
 import shutil
@@ -12,11 +18,24 @@ import os
 from pathlib import Path
 from datetime import datetime
 import platform
+import sysconfig
 
 # Projektverzeichnis
 PROJECT_ROOT = Path(__file__).parent
 RELEASE_DIR = PROJECT_ROOT / "releases"
 
+# Icon-Quelle und Hash-Datei (Icon wird nur neu erzeugt, wenn sich create_icon.py ändert)
+ICON_SOURCE = Path("create_icon.py")
+ICON_HASH_FILE = Path("app_icon.ico.sha")
+
+# pywebview liefert WebView2Loader.dll für jede Windows-Architektur mit
+# (webview/lib/runtimes/<arch>/) - eingepackt wird nur die des Build-Pythons
+WEBVIEW_RUNTIME_ARCHS = {
+    "win-amd64": "win-x64",
+    "win32": "win-x86",
+    "win-arm64": "win-arm64",
+}
+
 # Version aus version.txt lesen
 VERSION_FILE = PROJECT_ROOT / "version.txt"
 try:
@@ -148,28 +167,51 @@ def clean_build():
     return True
 
 
+def _icon_source_hash():
+    """SHA-256 von create_icon.py (None falls nicht vorhanden)"""
+    if not ICON_SOURCE.exists():
+        return None
+    return hashlib.sha256(ICON_SOURCE.read_bytes()).hexdigest()
+
+
 def create_icon_if_missing():
-    """Erstellt Icon falls nicht vorhanden"""
+    """Erstellt Icon falls nicht vorhanden oder create_icon.py geändert wurde"""
     icon_path = Path("app_icon.ico")
-    if not icon_path.exists():
+    source_hash = _icon_source_hash()
+
+    if icon_path.exists():
+        # Ohne Hash-Datei (frischer Checkout, die Datei ist nicht eingecheckt) ist
+        # unbekannt, ob das Icon zu create_icon.py passt - dann neu erzeugen
+        stored_hash = ICON_HASH_FILE.read_text().strip() if ICON_HASH_FILE.exists() else None
+        if source_hash is None or stored_hash == source_hash:
+            print("\n[OK] Icon gefunden: app_icon.ico")
+            return True
+        print("\n[INFO] Icon passt nicht (mehr) zu create_icon.py, erstelle Icon neu...")
+    else:
         print("\n[INFO] Icon nicht gefunden, erstelle Icon...")
-        try:
-            subprocess.run(
-                [sys.executable, "create_icon.py"],
-                check=True
-            )
-            if icon_path.exists():
-                print("[OK] Icon erstellt")
-                return True
-            else:
-                print("[WARNUNG] Icon konnte nicht erstellt werden")
-                return False
-        except subprocess.CalledProcessError as e:
-            print(f"[WARNUNG] Icon-Erstellung fehlgeschlagen: {e}")
+
+    old_mtime = icon_path.stat().st_mtime_ns if icon_path.exists() else None
+    try:
+        subprocess.run(
+            [sys.executable, "create_icon.py"],
+            check=True
+        )
+        if icon_path.exists() and icon_path.stat().st_mtime_ns != old_mtime:
+            if source_hash:
+                ICON_HASH_FILE.write_text(source_hash)
+            print("[OK] Icon erstellt")
+            return True
+        elif icon_path.exists():
+            # create_icon.py endet auch ohne Pillow erfolgreich - ohne Hash wird
+            # es beim nächsten Build erneut versucht
+            print("[WARNUNG] Icon nicht neu erzeugt, verwende vorhandenes app_icon.ico")
+            return True
+        else:
+            print("[WARNUNG] Icon konnte nicht erstellt werden")
             return False
-    else:
-        print("\n[OK] Icon gefunden: app_icon.ico")
-        return True
+    except subprocess.CalledProcessError as e:
+        print(f"[WARNUNG] Icon-Erstellung fehlgeschlagen: {e}")
+        return False
 
 
 def run_nuitka():
@@ -182,20 +224,38 @@ def run_nuitka():
     if debug_mode:
         print("[DEBUG] Debug-Modus aktiv - Konsole bleibt sichtbar")
 
+    # Onefile-Modus: eine einzelne .exe mit zstd-komprimiertem Payload
+    onefile_mode = "--onefile" in sys.argv
+    if onefile_mode:
+        print("[INFO] Onefile-Modus aktiv - erstelle einzelne .exe")
+
     # Nuitka Kommando zusammenstellen
     cmd = [
         sys.executable, "-m", "nuitka",
+    ]
 
+    if onefile_mode:
+        cmd.extend([
+            # Onefile impliziert Standalone; Payload wird mit zstd komprimiert
+            # (zstandard ist in requirements.txt enthalten)
+            "--onefile",
+            # Fester Entpack-Ordner pro Version: Folgestarts müssen nicht erneut entpacken
+            "--onefile-tempdir-spec={CACHE_DIR}/MGBFreizeitplaner/{VERSION}",
+            f"--product-version={VERSION}",
+            f"--file-version={VERSION}",
+        ])
+    else:
         # Standalone Mode
-        "--standalone",
+        cmd.append("--standalone")
 
+    cmd.extend([
         # Icon
         "--windows-icon-from-ico=app_icon.ico",
 
         # Output
         "--output-dir=dist",
         "--output-filename=MGBFreizeitplaner.exe",
-    ]
+    ])
 
     # Windows-spezifisch - Im Debug-Modus Konsole sichtbar lassen
     if platform.system() == "Windows":
@@ -204,6 +264,13 @@ def run_nuitka():
         else:
             cmd.append("--windows-console-mode=disable")
 
+        # WebView2-Runtimes anderer Architekturen weglassen
+        target_arch = WEBVIEW_RUNTIME_ARCHS.get(sysconfig.get_platform(), "win-x64")
+        for arch in WEBVIEW_RUNTIME_ARCHS.values():
+            if arch != target_arch:
+                cmd.append(f"--noinclude-data-files=webview/lib/runtimes/{arch}/*")
+                cmd.append(f"--noinclude-dlls=webview/lib/runtimes/{arch}/*")
+
     cmd.extend([
         # Includes - Pakete die eingebunden werden müssen
         "--include-package=app",
@@ -260,6 +327,16 @@ def run_nuitka():
         "--nofollow-import-to=IPython",
         "--nofollow-import-to=jupyter",
 
+        # Entspricht "python -OO": Asserts und Docstrings werden nicht mitkompiliert
+        # (kleinere Binary, weniger C-Code zu übersetzen)
+        "--python-flag=no_asserts",
+        "--python-flag=no_docstrings",
+
+        # Hash-Werte von String-Konstanten zur Compile-Zeit berechnen und site-Import
+        # überspringen - beschleunigt den Start (viele dict/set-Konstanten in den Frameworks)
+        "--python-flag=static_hashes",
+        "--python-flag=no_site",
+
         # Reduziere parallele Kompilierung um RAM zu sparen
 	    "--lto=no",
         "--jobs=5",
@@ -411,8 +488,12 @@ def create_release_zip():
 
     with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
         for root, dirs, files in os.walk(dist_dir):
-            # Überspringe Cache-Dateien
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.pytest_cache']]
+            # Überspringe Cache-Dateien und Nuitka-Zwischenordner (Onefile-Build liegt direkt in dist/)
+            dirs[:] = [
+                d for d in dirs
+                if d not in ['__pycache__', '.pytest_cache']
+                and not d.endswith(('.build', '.dist', '.onefile-build'))
+            ]
 
             for file in files:
                 if file.endswith('.pyc'):
@@ -476,7 +557,10 @@ def main():
     print("  BUILD ERFOLGREICH!")
     print("=" * 60)
     print("\n[OK] Desktop-Anwendung wurde erstellt:")
-    print("     dist/desktop_app.dist/")
+    if "--onefile" in sys.argv:
+        print("     dist/MGBFreizeitplaner.exe")
+    else:
+        print("     dist/desktop_app.dist/")
     print(f"\n[OK] Release-ZIP erstellt in:")
     print(f"     releases/MGBFreizeitplaner-{VERSION}-windows-desktop-*.zip")
     print("\n[INFO] Der komplette Ordner oder das ZIP kann")
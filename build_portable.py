@@ -4,14 +4,20 @@ Build-Skript für Portable Versionen von MGBFreizeitplaner
 
 Erstellt ZIP-Archive für Windows, macOS und Linux mit allen
 notwendigen Dateien für eine Standalone-Installation.
+
+Optionen:
+    --release   Maximale Kompression (Stufe 9) für zu veröffentlichende Archive
 """
 
 import os
+import sys
 import shutil
 import zipfile
 from pathlib import Path
 from datetime import datetime
 
+from jinja2 import Template
+
 # Projektverzeichnis
 PROJECT_ROOT = Path(__file__).parent
 BUILD_DIR = PROJECT_ROOT / "build"
@@ -24,6 +30,16 @@ try:
 except Exception:
     VERSION = "0.0.0"  # Fallback
 
+# Deflate-Stufe: 1 ist ~3x schneller als der Standard (6) bei kaum größeren Archiven,
+# für Veröffentlichungen mit --release maximale Kompression
+COMPRESS_LEVEL = 9 if "--release" in sys.argv else 1
+
+# Kleine Dateien werden in einem Stück gelesen und per writestr gepackt
+SMALL_FILE_LIMIT = 64 * 1024
+
+# Verzeichnisse, die beim Packen übersprungen werden
+SKIP_DIRS = frozenset(('__pycache__', '.git', '.pytest_cache'))
+
 # Dateien und Ordner, die inkludiert werden sollen
 INCLUDE_ITEMS = [
     "app/",
@@ -41,14 +57,27 @@ STARTUP_SCRIPTS = {
     "linux": ["start.sh"],
 }
 
-# Plattform-spezifische Hinweise
-PLATFORM_READMES = {
-    "windows": """# MGBFreizeitplaner - Portable Version für Windows
+# Plattform-spezifische Hinweise (QUICKSTART.md) - ein Template für alle Plattformen
+PLATFORM_NAMES = {
+    "windows": "Windows",
+    "macos": "macOS",
+    "linux": "Linux",
+}
+
+QUICKSTART_TEMPLATE = """# MGBFreizeitplaner - Portable Version für {{ platform_name }}
 
 ## Schnellstart
 
+{% if platform == "windows" %}
 1. **Doppelklick auf `start.bat`** (empfohlen für Anfänger)
    - Oder: Rechtsklick auf `start.ps1` → "Mit PowerShell ausführen"
+{% elif platform == "macos" %}
+1. **Doppelklick auf `start.sh`**
+   - Oder im Terminal: `./start.sh`
+{% else %}
+1. **Im Terminal ausführen: `./start.sh`**
+   - Oder Doppelklick (falls File Manager Skripte ausführen kann)
+{% endif %}
 
 2. Das Skript führt automatisch folgende Schritte aus:
    - Prüft Python-Installation
@@ -61,6 +90,7 @@ PLATFORM_READMES = {
 ## Voraussetzungen
 
 - **Python 3.11 oder höher** muss installiert sein
+{% if platform == "windows" %}
 - Download: https://www.python.org/downloads/
 - ⚠️ WICHTIG: Bei Installation "Add Python to PATH" aktivieren!
 
@@ -81,43 +111,7 @@ PLATFORM_READMES = {
 
 ### Firewall-Warnung
 → Klicke auf "Zugriff zulassen" wenn Windows Defender fragt
-
-## Konfiguration
-
-Bearbeite die `.env` Datei um Einstellungen anzupassen:
-- PORT=8000           # Server-Port ändern
-- DEBUG=false         # Debug-Modus aktivieren
-- SECRET_KEY=...      # Sicherheitsschlüssel
-
-## Portable Nutzung
-
-Diese Version kann auf einem USB-Stick verwendet werden:
-1. Kopiere den gesamten Ordner auf USB-Stick
-2. Starte mit start.bat auf jedem Windows-PC (mit Python)
-3. Datenbank (freizeit_kassen.db) wird im Ordner gespeichert
-
-## Support
-
-Bei Problemen: https://github.com/[YOUR_REPO]/issues
-""",
-    "macos": """# MGBFreizeitplaner - Portable Version für macOS
-
-## Schnellstart
-
-1. **Doppelklick auf `start.sh`**
-   - Oder im Terminal: `./start.sh`
-
-2. Das Skript führt automatisch folgende Schritte aus:
-   - Prüft Python-Installation
-   - Erstellt virtuelle Umgebung (beim ersten Start)
-   - Installiert Abhängigkeiten (beim ersten Start)
-   - Startet die Anwendung
-
-3. Browser öffnet automatisch unter: http://localhost:8000/auth
-
-## Voraussetzungen
-
-- **Python 3.11 oder höher** muss installiert sein
+{% elif platform == "macos" %}
 
 ### Python installieren:
 
@@ -152,43 +146,7 @@ xcode-select --install
 ### Gatekeeper Warnung
 → Rechtsklick auf start.sh → "Öffnen"
 → Bestätige "Öffnen" im Dialog
-
-## Konfiguration
-
-Bearbeite die `.env` Datei um Einstellungen anzupassen:
-- PORT=8000           # Server-Port ändern
-- DEBUG=false         # Debug-Modus aktivieren
-- SECRET_KEY=...      # Sicherheitsschlüssel
-
-## Portable Nutzung
-
-Diese Version kann auf einem USB-Stick verwendet werden:
-1. Kopiere den gesamten Ordner auf USB-Stick
-2. Starte mit ./start.sh auf jedem Mac (mit Python)
-3. Datenbank (freizeit_kassen.db) wird im Ordner gespeichert
-
-## Support
-
-Bei Problemen: https://github.com/[YOUR_REPO]/issues
-""",
-    "linux": """# MGBFreizeitplaner - Portable Version für Linux
-
-## Schnellstart
-
-1. **Im Terminal ausführen: `./start.sh`**
-   - Oder Doppelklick (falls File Manager Skripte ausführen kann)
-
-2. Das Skript führt automatisch folgende Schritte aus:
-   - Prüft Python-Installation
-   - Erstellt virtuelle Umgebung (beim ersten Start)
-   - Installiert Abhängigkeiten (beim ersten Start)
-   - Startet die Anwendung
-
-3. Browser öffnet automatisch unter: http://localhost:8000/auth
-
-## Voraussetzungen
-
-- **Python 3.11 oder höher** muss installiert sein
+{% else %}
 
 ### Python installieren:
 
@@ -229,6 +187,7 @@ sudo pacman -S python
 ### Build-Tools fehlen (für native Extensions)
 → Installiere Build-Essentials:
    sudo apt install build-essential python3-dev  # Ubuntu/Debian
+{% endif %}
 
 ## Konfiguration
 
@@ -241,16 +200,46 @@ Bearbeite die `.env` Datei um Einstellungen anzupassen:
 
 Diese Version kann auf einem USB-Stick verwendet werden:
 1. Kopiere den gesamten Ordner auf USB-Stick
-2. Starte mit ./start.sh auf jedem Linux-System (mit Python)
+2. Starte mit {{ start_command }} auf jedem {{ target_system }} (mit Python)
 3. Datenbank (freizeit_kassen.db) wird im Ordner gespeichert
 
 ## Support
 
 Bei Problemen: https://github.com/[YOUR_REPO]/issues
 """
+
+# Startbefehl und Zielsystem für den Abschnitt "Portable Nutzung"
+QUICKSTART_USAGE = {
+    "windows": ("start.bat", "Windows-PC"),
+    "macos": ("./start.sh", "Mac"),
+    "linux": ("./start.sh", "Linux-System"),
 }
 
 
+def render_quickstart(platform: str) -> str:
+    """Rendert die QUICKSTART.md für eine Plattform"""
+    start_command, target_system = QUICKSTART_USAGE[platform]
+    template = Template(QUICKSTART_TEMPLATE, trim_blocks=True, keep_trailing_newline=True)
+    return template.render(
+        platform=platform,
+        platform_name=PLATFORM_NAMES[platform],
+        start_command=start_command,
+        target_system=target_system,
+    )
+
+
+def _scan_project_root() -> dict:
+    """Indexiert PROJECT_ROOT einmalig (ein scandir statt stat() pro Plattform und Eintrag)"""
+    wanted = {item.rstrip("/") for item in INCLUDE_ITEMS}
+    wanted.update(script for scripts in STARTUP_SCRIPTS.values() for script in scripts)
+    with os.scandir(PROJECT_ROOT) as entries:
+        return {entry.name: entry.is_dir() for entry in entries if entry.name in wanted}
+
+
+# Name -> is_dir für alle benötigten Einträge im Projektverzeichnis
+_ROOT_INDEX = _scan_project_root()
+
+
 def clean_build_dirs():
     """Entfernt nur Dateien, die von diesem Skript erstellt wurden"""
     print("🧹 Räume alte Portable-Builds auf...")
@@ -280,15 +269,20 @@ def copy_project_files(target_dir: Path):
     print(f"📋 Kopiere Projektdateien nach {target_dir.name}...")
 
     for item in INCLUDE_ITEMS:
-        source = PROJECT_ROOT / item
-        if not source.exists():
+        is_dir = _ROOT_INDEX.get(item.rstrip("/"))
+        if is_dir is None:
             print(f"⚠️  Warnung: {item} nicht gefunden, überspringe...")
             continue
 
+        source = PROJECT_ROOT / item
         # Berechne Zielpfad
         dest = target_dir / item
 
-        if source.is_dir():
+        if is_dir and os.name != "nt" and not dest.exists():
+            # Unix: Verzeichnis nur verlinken - der ZIP-Schritt liest ohnehin die Quelle
+            dest.symlink_to(source.resolve(), target_is_directory=True)
+            print(f"  ✓ {item} (Symlink)")
+        elif is_dir:
             # Kopiere Verzeichnis
             shutil.copytree(source, dest, dirs_exist_ok=True)
             print(f"  ✓ {item}")
@@ -313,18 +307,17 @@ def create_platform_package(platform: str):
     # Kopiere Startup-Skripte für diese Plattform
     print(f"📝 Füge Startup-Skripte hinzu...")
     for script in STARTUP_SCRIPTS.get(platform, []):
-        source = PROJECT_ROOT / script
-        if source.exists():
+        if script in _ROOT_INDEX:
             dest = platform_dir / script
-            shutil.copy2(source, dest)
+            shutil.copy2(PROJECT_ROOT / script, dest)
             # Mache ausführbar (für Unix-Systeme)
             if script.endswith('.sh'):
                 dest.chmod(0o755)
             print(f"  ✓ {script}")
 
     # Erstelle plattform-spezifische README
-    readme_content = PLATFORM_READMES.get(platform, "")
-    if readme_content:
+    if platform in QUICKSTART_USAGE:
+        readme_content = render_quickstart(platform)
         readme_path = platform_dir / "QUICKSTART.md"
         readme_path.write_text(readme_content, encoding='utf-8')
         print(f"  ✓ QUICKSTART.md")
@@ -335,18 +328,27 @@ def create_platform_package(platform: str):
     zip_path = RELEASE_DIR / zip_name
 
     print(f"🗜️  Erstelle ZIP-Archiv: {zip_name}")
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(platform_dir):
+    # Archivname per String-Slicing statt Path.relative_to (tausende Dateien)
+    build_prefix_len = len(str(BUILD_DIR)) + 1
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as zipf:
+        # followlinks: verlinkte Projektverzeichnisse (Unix) mit einpacken
+        for root, dirs, files in os.walk(platform_dir, followlinks=True):
             # Überspringe __pycache__ und andere Python-Cache-Dateien
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', '.pytest_cache']]
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
             for file in files:
                 if file.endswith('.pyc'):
                     continue
 
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(BUILD_DIR)
-                zipf.write(file_path, arcname)
+                file_path = os.path.join(root, file)
+                arcname = file_path[build_prefix_len:]
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                if zinfo.file_size < SMALL_FILE_LIMIT:
+                    with open(file_path, 'rb') as f:
+                        data = f.read()
+                    zipf.writestr(zinfo, data, zipfile.ZIP_DEFLATED, COMPRESS_LEVEL)
+                else:
+                    zipf.write(file_path, arcname)
 
     # Dateigröße anzeigen
     size_mb = zip_path.stat().st_size / (1024 * 1024)
@@ -360,6 +362,7 @@ def create_all_packages():
     print("\n" + "="*60)
     print("🚀 MGBFreizeitplaner - Portable Build")
     print(f"📌 Version: {VERSION}")
+    print(f"🗜️  Kompressionsstufe: {COMPRESS_LEVEL}")
     print("="*60 + "\n")
 
     # Aufräumen
@@ -4,22 +4,45 @@ Build-Skript für Standalone Portable Versionen von MGBFreizeitplaner
 
 Erstellt vollständig eigenständige ZIP-Archive mit embedded Python
 für Windows, macOS und Linux - KEINE Python-Installation erforderlich!
+
+Abgebrochene Builds werden beim nächsten Lauf fortgesetzt (fertige Schritte
+sind im Build-Ordner markiert).
+
+Optionen:
+    --force     Build-Ordner verwerfen und alle Schritte neu ausführen
+    --release   Maximale ZIP-Kompression (Stufe 9) für zu veröffentlichende Archive
 """
 
+import hashlib
+import io
 import os
+import re
 import sys
 import shutil
+import subprocess
+import threading
+import time
+import traceback
 import zipfile
-import urllib.request
-import ssl
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
+import httpx
+
 # Projektverzeichnis
 PROJECT_ROOT = Path(__file__).parent
 BUILD_DIR = PROJECT_ROOT / "build"
 RELEASE_DIR = PROJECT_ROOT / "releases"
 DOWNLOAD_CACHE = PROJECT_ROOT / ".download_cache"
+GET_PIP_CACHE = DOWNLOAD_CACHE / "get-pip.py"
+# pip-Cache und vorgebaute Wheels, bleiben zwischen Builds erhalten
+PIP_CACHE = PROJECT_ROOT / ".pip_cache"
+WHEEL_DIR = PROJECT_ROOT / ".wheel_cache"
+# Pro Plattform aufgelöste Dependencies (pip download --platform ...)
+DEPS_DIR = PROJECT_ROOT / ".resolved_deps"
 
 # Version aus version.txt lesen
 VERSION_FILE = PROJECT_ROOT / "version.txt"
@@ -34,6 +57,10 @@ PYTHON_VERSIONS = {
         "version": "3.11.9",
         "url": "https://www.python.org/ftp/python/3.11.9/python-3.11.9-embed-amd64.zip",
         "size_mb": 10,
+        # Optional: SHA-256 von der Release-Seite, sonst nur Cache-Prüfsumme
+        "sha256": None,
+        "pip_platforms": ["win_amd64"],
+        "pip_sha256": None,
         "pip_url": "https://bootstrap.pypa.io/get-pip.py"
     },
     "macos": {
@@ -41,16 +68,81 @@ PYTHON_VERSIONS = {
         # Python Standalone Builds von Gregory Szorc
         "url": "https://github.com/indygreg/python-build-standalone/releases/download/20240107/cpython-3.11.7+20240107-x86_64-apple-darwin-install_only.tar.gz",
         "size_mb": 40,
+        "sha256": None,
+        # pip erweitert das auf neuere macOS-Versionen und universal2
+        "pip_platforms": ["macosx_10_9_x86_64"],
         "arch": "x86_64"
     },
     "linux": {
         "version": "3.11.9",
         "url": "https://github.com/indygreg/python-build-standalone/releases/download/20240107/cpython-3.11.7+20240107-x86_64-unknown-linux-gnu-install_only.tar.gz",
         "size_mb": 45,
+        "sha256": None,
+        # glibc 2.17 wie python-build-standalone selbst
+        "pip_platforms": ["manylinux_2_17_x86_64", "manylinux2014_x86_64"],
         "arch": "x86_64"
     }
 }
 
+# Downloads: 1 MiB Lesepuffer, große Dateien über parallele Range-Requests
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+DOWNLOAD_CONNECTIONS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+# install_only-Archive von python-build-standalone liegen unter python/
+PYTHON_TAR_PREFIX = "python/"
+
+# Request mit User-Agent Header (GitHub requires this)
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    # Keine Transport-Kompression: Content-Length, Größenprüfung und Range-Offsets
+    # beziehen sich sonst auf die komprimierten statt auf die Datei-Bytes
+    'Accept-Encoding': 'identity',
+}
+# Ein Client mit Connection-Pool (Keep-Alive) und einem SSL-Kontext für alle
+# Downloads des Laufs, erst beim ersten Download erzeugt (siehe get_http_client)
+_http_client = None
+_http_client_lock = threading.Lock()
+# Fortschrittsanzeige höchstens alle 0,25 s aktualisieren
+PROGRESS_INTERVAL = 0.25
+
+# ._pth-Datei des Windows embedded Python (Zeilen, die gesetzt sein müssen)
+_PTH_IMPORT_SITE = re.compile(r'^#\s*import\s+site\s*$', re.M)
+_PTH_REQUIRED_LINES = (
+    (re.compile(r'^Lib[\\/]site-packages\s*$', re.M), "Lib\\site-packages"),
+    (re.compile(r'^\.\.\s*$', re.M), ".."),
+)
+
+# Bereits erledigte Build-Schritte werden per Marker-Datei übersprungen
+FORCE_REBUILD = "--force" in sys.argv
+PYTHON_SETUP_MARKER = ".python_setup.done"
+DEPS_INSTALLED_MARKER = ".deps_installed.done"
+BUILD_MARKERS = frozenset((PYTHON_SETUP_MARKER, DEPS_INSTALLED_MARKER))
+# Grob geschätzter Platzbedarf pro Plattform zusätzlich zum Python-Download:
+# entpacktes Python (~3x Download), Dependencies und die beiden Archive
+EXTRA_SPACE_MB_PER_PLATFORM = 250
+
+# Verzeichnisse, die beim Packen übersprungen werden
+SKIP_DIRS = frozenset(('__pycache__', '.git', '.pytest_cache'))
+COPY_IGNORE = shutil.ignore_patterns(*SKIP_DIRS, '*.pyc')
+
+# Kompression: zstd für .tar.zst; Deflate-Stufe für das ZIP wie in den
+# anderen Build-Skripten: 1 für schnelle Test-Builds, 9 mit --release
+ZSTD_LEVEL = 10
+ZIP_COMPRESS_LEVEL = 9 if "--release" in sys.argv else 1
+
+# create_zip_parallel schreibt vorab komprimierte Einträge direkt über die
+# privaten ZipFile-Felder fp, start_dir, filelist und NameToInfo (an
+# _writecheck() und _lock vorbei). Getestet mit CPython 3.11, 3.12 und 3.13;
+# andere Versionen nehmen den langsameren Weg über ZipFile.write()
+ZIP_INTERNALS_SUPPORTED = (
+    sys.implementation.name == "cpython" and (3, 11) <= sys.version_info[:2] <= (3, 13)
+)
+
+# Build-Werkzeuge aus requirements.txt, die nicht ins embedded Python gehören
+# (Nuitka und seine Helfer; nuitka gibt es auf PyPI nur als sdist)
+BUILD_ONLY_PACKAGES = frozenset(("nuitka", "ordered-set", "pefile"))
+_REQUIREMENT_NAME = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
 # Dateien und Ordner, die inkludiert werden sollen
 INCLUDE_ITEMS = [
     "app/",
@@ -69,42 +161,202 @@ STARTUP_SCRIPTS = {
 }
 
 
+class ProgressPrinter:
+    """Thread-sichere Fortschrittsanzeige, die höchstens alle PROGRESS_INTERVAL Sekunden ausgibt"""
+
+    def __init__(self, total_size: int):
+        self.total_size = total_size
+        self.downloaded = 0
+        self._last_print = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, size: int):
+        with self._lock:
+            self.downloaded += size
+            now = time.monotonic()
+            if now - self._last_print >= PROGRESS_INTERVAL:
+                self._last_print = now
+                self._print()
+
+    def finish(self):
+        with self._lock:
+            self._print()
+
+    def _print(self):
+        if self.total_size <= 0:
+            return
+        percent = (self.downloaded / self.total_size) * 100
+        mb_downloaded = self.downloaded / (1024 * 1024)
+        mb_total = self.total_size / (1024 * 1024)
+        print(f"\r   Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end='')
+
+
+class ProgressReader:
+    """Datei-artiger Wrapper um eine HTTP-Antwort, der jeden read() an den ProgressPrinter meldet"""
+
+    def __init__(self, response, progress: ProgressPrinter):
+        self._response = response
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        buffer = self._response.read(size)
+        self._progress.update(len(buffer))
+        return buffer
+
+
+class StreamResponse:
+    """Datei-artiger Zugriff (read) auf eine gestreamte httpx-Antwort"""
+
+    def __init__(self, response: httpx.Response):
+        self.status = response.status_code
+        self.headers = response.headers
+        # Server, die trotz "identity" komprimieren: iter_bytes() dekodiert,
+        # die Längenangaben gelten dann aber nicht für die Datei
+        self.content_encoded = response.headers.get('content-encoding', 'identity').lower() != 'identity'
+        self._chunks = response.iter_bytes(DOWNLOAD_BLOCK_SIZE)
+        self._chunk = b""
+        self._pos = 0
+
+    @property
+    def expected_size(self) -> int:
+        """Dateigröße laut Content-Length (0 = unbekannt bzw. kodierte Übertragung)"""
+        if self.content_encoded:
+            return 0
+        return int(self.headers.get('content-length', 0))
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        while size != 0:
+            if self._pos >= len(self._chunk):
+                self._chunk = next(self._chunks, b"")
+                self._pos = 0
+                if not self._chunk:
+                    break
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._pos + size)
+            parts.append(self._chunk[self._pos:end])
+            if size > 0:
+                size -= end - self._pos
+            self._pos = end
+        return b"".join(parts)
+
+
+def get_http_client() -> httpx.Client:
+    """Gibt den gemeinsamen HTTP-Client zurück und legt ihn beim ersten Aufruf an
+
+    Die Pool-Limits gehören an den Transport - httpx ignoriert limits= am
+    Client, sobald ein eigener transport= übergeben wird. ssl wird erst hier
+    geladen und das CA-Bundle nur einmal gelesen; Builds aus dem Cache
+    brauchen beides nicht.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            import ssl
+            ssl_context = ssl.create_default_context()
+            limits = httpx.Limits(max_connections=2 * DOWNLOAD_CONNECTIONS,
+                                  max_keepalive_connections=2 * DOWNLOAD_CONNECTIONS)
+            _http_client = httpx.Client(
+                headers=DOWNLOAD_HEADERS,
+                follow_redirects=True,
+                timeout=httpx.Timeout(30.0),
+                transport=httpx.HTTPTransport(verify=ssl_context, retries=3, limits=limits),
+            )
+        return _http_client
+
+
+def close_http_client():
+    """Schließt den gemeinsamen HTTP-Client (offene Keep-Alive-Verbindungen)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+@contextmanager
+def open_url(url: str, headers: dict):
+    """Öffnet eine URL über den gemeinsamen Client (Verbindungen werden wiederverwendet)"""
+    with get_http_client().stream('GET', url, headers=headers) as response:
+        response.raise_for_status()
+        yield StreamResponse(response)
+
+
+def _probe_range_support(url: str, headers: dict) -> int:
+    """Liefert die Dateigröße, falls der Server Byte-Range-Requests unterstützt, sonst 0"""
+    with open_url(url, {**headers, 'Range': 'bytes=0-0'}) as response:
+        if response.status != 206 or response.content_encoded:
+            return 0
+        # Content-Range: bytes 0-0/12345678
+        total = response.headers.get('Content-Range', '').rpartition('/')[2]
+        return int(total) if total.isdigit() else 0
+
+
+def _download_parallel(url: str, destination: Path, headers: dict, total_size: int):
+    """Lädt eine Datei mit mehreren parallelen Range-Requests herunter"""
+    # Datei vorab auf Endgröße bringen, jeder Thread schreibt an seinen Offset
+    with open(destination, 'wb') as f:
+        f.truncate(total_size)
+
+    chunk_size = -(-total_size // DOWNLOAD_CONNECTIONS)
+    ranges = [
+        (start, min(start + chunk_size, total_size) - 1)
+        for start in range(0, total_size, chunk_size)
+    ]
+
+    progress = ProgressPrinter(total_size)
+
+    def fetch(byte_range):
+        start, end = byte_range
+        range_headers = {**headers, 'Range': f'bytes={start}-{end}'}
+        with open_url(url, range_headers) as response, open(destination, 'r+b') as f:
+            if response.status != 206:
+                raise OSError(f"Server lieferte Status {response.status} statt 206 für Range {start}-{end}")
+            f.seek(start)
+            shutil.copyfileobj(ProgressReader(response, progress), f, DOWNLOAD_BLOCK_SIZE)
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        # list() reicht Exceptions aus den Threads weiter
+        list(executor.map(fetch, ranges))
+    progress.finish()
+
+
+def _download_single(url: str, destination: Path, headers: dict):
+    """Lädt eine Datei über eine einzelne Verbindung herunter"""
+    with open_url(url, headers) as response:
+        expected_size = response.expected_size
+        progress = ProgressPrinter(expected_size)
+        with open(destination, 'wb') as f:
+            shutil.copyfileobj(ProgressReader(response, progress), f, DOWNLOAD_BLOCK_SIZE)
+        progress.finish()
+
+    # Abgebrochene Verbindungen hinterlassen sonst eine abgeschnittene Datei
+    if expected_size and destination.stat().st_size != expected_size:
+        raise OSError(f"Unvollständiger Download ({destination.stat().st_size} von {expected_size} Bytes)")
+
+
 def download_file(url: str, destination: Path, description: str = "Datei"):
-    """Lädt eine Datei mit Fortschrittsanzeige herunter"""
+    """Lädt eine Datei mit Fortschrittsanzeige herunter
+
+    Große Dateien werden - sofern der Server Range-Requests unterstützt -
+    über mehrere parallele Verbindungen geladen.
+    """
     print(f"📥 Lade {description} herunter...")
     print(f"   URL: {url}")
 
     destination.parent.mkdir(parents=True, exist_ok=True)
 
-    # SSL context für Downloads
-    ssl_context = ssl.create_default_context()
-
-    # Request mit User-Agent Header (GitHub requires this)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    request = urllib.request.Request(url, headers=headers)
+    headers = DOWNLOAD_HEADERS
 
     try:
-        with urllib.request.urlopen(request, context=ssl_context) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-
-            with open(destination, 'wb') as f:
-                while True:
-                    buffer = response.read(block_size)
-                    if not buffer:
-                        break
-
-                    downloaded += len(buffer)
-                    f.write(buffer)
-
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        mb_downloaded = downloaded / (1024 * 1024)
-                        mb_total = total_size / (1024 * 1024)
-                        print(f"\r   Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end='')
+        total_size = _probe_range_support(url, headers)
+        if total_size >= PARALLEL_DOWNLOAD_MIN_SIZE:
+            try:
+                _download_parallel(url, destination, headers, total_size)
+            except (OSError, httpx.HTTPError) as e:
+                print(f"\n⚠️  Paralleler Download fehlgeschlagen ({e}), lade über eine Verbindung...")
+                _download_single(url, destination, headers)
+        else:
+            _download_single(url, destination, headers)
 
         print()  # Neue Zeile nach Download
         print(f"✅ Download abgeschlossen: {destination.name}")
@@ -115,6 +367,134 @@ def download_file(url: str, destination: Path, description: str = "Datei"):
         return False
 
 
+def _file_sha256(path: Path) -> str:
+    """Berechnet die SHA-256-Prüfsumme einer Datei"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def _cached_archive_valid(python_info: dict, cache_file: Path) -> bool:
+    """Prüft das gecachte Archiv gegen seine .sha256-Datei (und ggf. den Pin)"""
+    checksum_file = cache_file.with_name(cache_file.name + ".sha256")
+    if not (cache_file.exists() and checksum_file.exists()):
+        return False
+
+    digest = _file_sha256(cache_file)
+    if digest == checksum_file.read_text().strip() and python_info.get("sha256") in (None, digest):
+        print(f"✅ Verwende gecachte Datei: {cache_file.name}")
+        return True
+
+    print(f"⚠️  Gecachte Datei {cache_file.name} ist beschädigt, lade neu...")
+    return False
+
+
+def _store_checksum(python_info: dict, cache_file: Path, digest: str) -> bool:
+    """Vergleicht mit dem Pin und schreibt die .sha256-Datei zum Archiv"""
+    expected = python_info.get("sha256")
+    if expected is not None and digest != expected:
+        print(f"❌ Prüfsumme von {cache_file.name} stimmt nicht (erwartet {expected}, erhalten {digest})")
+        cache_file.unlink()
+        return False
+
+    cache_file.with_name(cache_file.name + ".sha256").write_text(digest + "\n")
+    return True
+
+
+def fetch_cached_download(python_info: dict, cache_file: Path, description: str) -> bool:
+    """Stellt einen Download (Python-Archiv, get-pip.py) im Download-Cache bereit
+
+    Neben der Datei liegt eine .sha256-Datei. Stimmt die Prüfsumme (und ggf.
+    die in PYTHON_VERSIONS hinterlegte) nicht, wird neu heruntergeladen.
+    """
+    if _cached_archive_valid(python_info, cache_file):
+        return True
+
+    if not download_file(python_info["url"], cache_file, description):
+        cache_file.unlink(missing_ok=True)
+        return False
+
+    return _store_checksum(python_info, cache_file, _file_sha256(cache_file))
+
+
+class TeeReader:
+    """Reicht gelesene Daten weiter und schreibt sie gleichzeitig in den Cache"""
+
+    def __init__(self, response, progress: ProgressPrinter, cache, hasher):
+        self._response = response
+        self._progress = progress
+        self._cache = cache
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._response.read(size)
+        self._cache.write(data)
+        self._hasher.update(data)
+        self._progress.update(len(data))
+        return data
+
+
+def extract_python_members(tar_ref, destination: Path):
+    """Entpackt die Python-Distribution ohne das Präfix python/
+
+    Die Pfade werden beim Entpacken umgeschrieben, dadurch landen die Dateien
+    sofort an ihrem Ziel und müssen nicht nachträglich verschoben werden.
+    """
+    for member in tar_ref:
+        if not member.name.startswith(PYTHON_TAR_PREFIX):
+            continue
+        member.name = member.name[len(PYTHON_TAR_PREFIX):]
+        if not member.name:
+            continue
+        if member.islnk():
+            member.linkname = member.linkname.removeprefix(PYTHON_TAR_PREFIX)
+        tar_ref.extract(member, destination, filter='data')
+
+
+def download_and_extract_tar_gz(python_info: dict, cache_file: Path, destination: Path, description: str) -> bool:
+    """Lädt ein .tar.gz herunter und entpackt es direkt aus dem Datenstrom
+
+    Die Bytes gehen Netzwerk → gzip → tar, parallel wird das Archiv in den
+    Download-Cache geschrieben. Es muss also nicht erst gespeichert und dann
+    erneut von der Platte gelesen werden.
+    """
+    import tarfile
+
+    url = python_info["url"]
+    print(f"📥 Lade und entpacke {description}...")
+    print(f"   URL: {url}")
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    destination.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+
+    try:
+        with open_url(url, DOWNLOAD_HEADERS) as response, \
+                open(cache_file, 'wb') as cache:
+            expected_size = response.expected_size
+            progress = ProgressPrinter(expected_size)
+            reader = TeeReader(response, progress, cache, hasher)
+
+            # 'r|gz': Streaming-Modus, kein Zurückspringen im Datenstrom nötig
+            with tarfile.open(fileobj=reader, mode='r|gz') as tar_ref:
+                extract_python_members(tar_ref, destination)
+            # Rest hinter dem tar-Ende ebenfalls in den Cache übernehmen
+            while reader.read(DOWNLOAD_BLOCK_SIZE):
+                pass
+            progress.finish()
+
+        if expected_size and cache_file.stat().st_size != expected_size:
+            raise OSError(f"Unvollständiger Download ({cache_file.stat().st_size} von {expected_size} Bytes)")
+
+    except Exception as e:
+        print(f"\n❌ Fehler beim Download/Entpacken: {e}")
+        cache_file.unlink(missing_ok=True)
+        return False
+
+    print()  # Neue Zeile nach Download
+    print(f"✅ Entpackt nach: {destination}")
+    return _store_checksum(python_info, cache_file, hasher.hexdigest())
+
+
 def extract_archive(archive_path: Path, destination: Path, archive_type: str = "zip"):
     """Entpackt ein Archiv"""
     print(f"📦 Entpacke {archive_path.name}...")
@@ -148,19 +528,17 @@ def setup_embedded_python_windows(platform_dir: Path) -> bool:
     # Download Python embeddable
     cache_file = DOWNLOAD_CACHE / f"python-{python_info['version']}-embed-amd64.zip"
 
-    if not cache_file.exists():
-        if not download_file(python_info["url"], cache_file, f"Python {python_info['version']} Embeddable"):
-            return False
-    else:
-        print(f"✅ Verwende gecachte Datei: {cache_file.name}")
+    if not fetch_cached_download(python_info, cache_file, f"Python {python_info['version']} Embeddable"):
+        return False
 
     # Entpacke Python
     if not extract_archive(cache_file, python_dir):
         return False
 
-    # Download get-pip.py
-    pip_installer = python_dir / "get-pip.py"
-    if not download_file(python_info["pip_url"], pip_installer, "pip installer"):
+    # get-pip.py liegt im Download-Cache und wird von dort ausgeführt
+    # (das embeddable Python bringt kein ensurepip mit)
+    pip_info = {"url": python_info["pip_url"], "sha256": python_info.get("pip_sha256")}
+    if not fetch_cached_download(pip_info, GET_PIP_CACHE, "pip installer"):
         return False
 
     # Aktiviere site-packages (wichtig für pip)
@@ -168,18 +546,18 @@ def setup_embedded_python_windows(platform_dir: Path) -> bool:
     pth_files = list(python_dir.glob("python*._pth"))
     if pth_files:
         pth_file = pth_files[0]
-        content = pth_file.read_text()
+        original = pth_file.read_text()
         # Uncomment "import site" Zeile
-        content = content.replace("#import site", "import site")
+        content = _PTH_IMPORT_SITE.sub("import site", original)
 
-        # Füge notwendige Pfade hinzu (wie in build_standalone_windows.py)
-        if "Lib\\site-packages" not in content:
-            content += "\nLib\\site-packages\n"
-        # Füge Parent-Directory hinzu (wo app/ liegt)
-        if ".." not in content:
-            content += "..\n"
+        # Füge notwendige Pfade hinzu (wie in build_standalone_windows.py):
+        # site-packages und das Parent-Directory (wo app/ liegt)
+        missing = [line for pattern, line in _PTH_REQUIRED_LINES if not pattern.search(content)]
+        if missing:
+            content = content.rstrip("\n") + "\n" + "\n".join(missing) + "\n"
 
-        pth_file.write_text(content)
+        if content != original:
+            pth_file.write_text(content)
         print(f"✅ Site-packages aktiviert und Pfade konfiguriert in {pth_file.name}")
 
     print("✅ Embedded Python für Windows eingerichtet")
@@ -198,59 +576,95 @@ def setup_embedded_python_unix(platform_dir: Path, platform: str) -> bool:
     cache_filename = url_parts[-1]
     cache_file = DOWNLOAD_CACHE / cache_filename
 
-    if not cache_file.exists():
-        if not download_file(python_info["url"], cache_file, f"Python Standalone für {platform}"):
+    # Gecachtes Archiv von der Platte entpacken, sonst direkt aus dem Download
+    if _cached_archive_valid(python_info, cache_file):
+        import tarfile
+        print(f"📦 Entpacke {cache_file.name}...")
+        try:
+            with tarfile.open(cache_file, 'r:gz') as tar_ref:
+                extract_python_members(tar_ref, python_dir)
+        except Exception as e:
+            print(f"❌ Fehler beim Entpacken: {e}")
             return False
-    else:
-        print(f"✅ Verwende gecachte Datei: {cache_file.name}")
-
-    # Entpacke Python
-    if not extract_archive(cache_file, python_dir, "tar.gz"):
+        print(f"✅ Entpackt nach: {python_dir}")
+    elif not download_and_extract_tar_gz(python_info, cache_file, python_dir, f"Python Standalone für {platform}"):
         return False
 
-    # Python Standalone Builds haben die Struktur: python/install/...
-    # Wir müssen das richtige Verzeichnis finden
-    install_dir = python_dir / "python" / "install"
-    if install_dir.exists():
-        # Verschiebe Inhalte eine Ebene hoch
-        temp_dir = python_dir.parent / "temp_python"
-        shutil.move(str(install_dir), str(temp_dir))
-        shutil.rmtree(python_dir)
-        shutil.move(str(temp_dir), str(python_dir))
-
     print(f"✅ Standalone Python für {platform} eingerichtet")
     return True
 
 
+def get_python_exe(platform_dir: Path, platform: str) -> Path:
+    """Pfad zum Python-Interpreter im Paket"""
+    if platform == "windows":
+        return platform_dir / "python" / "python.exe"
+    return platform_dir / "python" / "bin" / "python3"
+
+
+def runtime_requirements() -> Path:
+    """Schreibt requirements.txt ohne BUILD_ONLY_PACKAGES nach build/ und gibt den Pfad zurück"""
+    lines = []
+    for line in (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines():
+        match = _REQUIREMENT_NAME.match(line)
+        if match and re.sub(r'[._-]+', '-', match.group(1)).lower() in BUILD_ONLY_PACKAGES:
+            continue
+        lines.append(line)
+    content = "\n".join(lines) + "\n"
+
+    requirements = BUILD_DIR / "requirements-runtime.txt"
+    if not requirements.exists() or requirements.read_text(encoding="utf-8") != content:
+        BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        requirements.write_text(content, encoding="utf-8")
+    return requirements
+
+
 def install_dependencies(platform_dir: Path, platform: str) -> bool:
     """Installiert Python-Dependencies in embedded Python"""
     print(f"\n📦 Installiere Dependencies für {platform}...")
 
-    python_dir = platform_dir / "python"
-    requirements = PROJECT_ROOT / "requirements.txt"
+    requirements = runtime_requirements()
 
+    python_exe = get_python_exe(platform_dir, platform)
+    base_cmd = [
+        str(python_exe), '-m', 'pip', 'install', '-r', str(requirements),
+        # Bytecode erzeugt compile_bytecode() einmal zentral
+        '--no-compile', '--disable-pip-version-check',
+    ]
     if platform == "windows":
-        python_exe = python_dir / "python.exe"
-        pip_cmd = f'"{python_exe}" -m pip install -r "{requirements}" --no-warn-script-location'
-    else:
-        python_exe = python_dir / "bin" / "python3"
-        pip_cmd = f'"{python_exe}" -m pip install -r "{requirements}"'
+        base_cmd.append('--no-warn-script-location')
+    # Gemeinsamer Cache + Wheelhouse: keine erneuten Downloads/Kompilierungen
+    online_cmd = base_cmd + [
+        '--cache-dir', str(PIP_CACHE), '--find-links', str(WHEEL_DIR),
+        # Kein --only-binary: einige reine Python-Pakete (z.B. proxy_tools) gibt es nur als sdist
+        '--prefer-binary',
+    ]
+    # Vorab aufgelöst: pip löst auch transitive Abhängigkeiten (requirements.txt
+    # ist kein vollständiger Lock) aus den heruntergeladenen Wheels auf, ohne Netzwerk
+    offline_cmd = base_cmd + ['--no-index', '--find-links', str(DEPS_DIR / platform)]
 
     # Erst pip installieren (für Windows embedded)
     if platform == "windows":
-        get_pip = python_dir / "get-pip.py"
         print("  Installing pip...")
-        install_pip_cmd = f'"{python_exe}" "{get_pip}" --no-warn-script-location'
-        result = os.system(install_pip_cmd)
-        if result != 0:
+        try:
+            subprocess.run([str(python_exe), str(GET_PIP_CACHE), '--no-warn-script-location'], check=True)
+        except (OSError, subprocess.CalledProcessError):
             print("❌ Pip-Installation fehlgeschlagen")
             return False
 
     # Dependencies installieren
     print(f"  Installing requirements from {requirements.name}...")
-    result = os.system(pip_cmd)
-
-    if result != 0:
+    if deps_resolved(platform):
+        try:
+            subprocess.run(offline_cmd, check=True)
+            print("✅ Dependencies installiert")
+            return True
+        except (OSError, subprocess.CalledProcessError):
+            # z.B. Abhängigkeiten mit Plattform-Markern, die pip download auf
+            # dem Host nicht für die Zielplattform auswertet
+            print("⚠️  Offline-Installation unvollständig, installiere online nach...")
+    try:
+        subprocess.run(online_cmd, check=True)
+    except (OSError, subprocess.CalledProcessError):
         print("❌ Dependency-Installation fehlgeschlagen")
         return False
 
@@ -258,6 +672,133 @@ def install_dependencies(platform_dir: Path, platform: str) -> bool:
     return True
 
 
+def compile_bytecode(platform_dir: Path, platform: str, manifest: list) -> bool:
+    """Kompiliert app/ und site-packages vorab und nimmt die .pyc ins Manifest auf
+
+    Kompiliert wird mit dem Python des Pakets (passende Magic Number).
+    Hash-basierte .pyc (PEP 552) bleiben gültig, auch wenn beim Entpacken
+    die Zeitstempel verloren gehen.
+    """
+    print("\n⚙️  Kompiliere app/ und Dependencies vor...")
+    python_exe = get_python_exe(platform_dir, platform)
+    compile_dirs = [platform_dir / "app"]
+    compile_dirs += [d for d in (platform_dir / "python").rglob("site-packages") if d.is_dir()]
+
+    compile_cmd = [
+        str(python_exe), '-m', 'compileall', '-q', '-j', '0',
+        '--invalidation-mode', 'checked-hash',
+        *(str(d) for d in compile_dirs),
+    ]
+    try:
+        subprocess.run(compile_cmd, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        print("⚠️  Vorkompilieren fehlgeschlagen, Module werden beim ersten Start kompiliert")
+        return False
+
+    prefix_len = len(str(platform_dir.parent)) + 1
+    for compile_dir in compile_dirs:
+        for pyc_file in compile_dir.rglob("*.pyc"):
+            file_path = str(pyc_file)
+            manifest.append((file_path, file_path[prefix_len:]))
+
+    print("✅ Bytecode erzeugt")
+    return True
+
+
+def run_host_pip(args: list) -> bool:
+    """Führt pip mit dem Host-Python aus, bevorzugt im selben Prozess
+
+    Spart Interpreter-Start und pip-Import. pip._internal ist keine
+    öffentliche API, daher bei Bedarf Fallback auf einen Subprozess.
+    Installationen in das Python des Pakets laufen immer als Subprozess.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        pip_main = None
+
+    if pip_main is not None:
+        try:
+            return pip_main(args) == 0
+        except SystemExit as e:
+            return e.code in (None, 0)
+
+    try:
+        subprocess.run([sys.executable, '-m', 'pip', *args], check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def deps_resolved(platform: str) -> bool:
+    """Prüft, ob die Dependencies der Plattform zu den Laufzeit-Requirements passen"""
+    stamp = DEPS_DIR / platform / ".requirements"
+    requirements = runtime_requirements()
+    return stamp.exists() and stamp.read_bytes() == requirements.read_bytes()
+
+
+def resolve_dependencies(platform: str) -> bool:
+    """Lädt alle Wheels für die Ziel-Plattform einmal mit dem Host-pip herunter
+
+    Der Resolver läuft so nur einmal pro Plattform (und bei unveränderter
+    requirements.txt gar nicht mehr); die Installation im Paket ist danach
+    ein reines Entpacken ohne Netzwerk.
+    """
+    if deps_resolved(platform):
+        print(f"✅ Dependencies für {platform} bereits aufgelöst")
+        return True
+
+    print(f"\n🔎 Löse Dependencies für {platform} auf...")
+    python_info = PYTHON_VERSIONS[platform]
+    # Ohne Build-Werkzeuge: --platform verlangt --only-binary, nuitka hat kein Wheel
+    requirements = runtime_requirements()
+    deps_dir = DEPS_DIR / platform
+    deps_dir.mkdir(parents=True, exist_ok=True)
+
+    # Ohne --no-deps: pip download lädt auch alle transitiven Abhängigkeiten
+    # (z.B. typing-inspection für pydantic, bottle/proxy_tools für pywebview)
+    download_args = [
+        'download', '-r', str(requirements), '-d', str(deps_dir),
+        '--only-binary=:all:', '--implementation', 'cp',
+        '--python-version', python_info["version"].rsplit(".", 1)[0],
+        # Reine Python-Wheels aus dem Wheelhouse (für sdist-only Pakete wie proxy_tools)
+        '--find-links', str(WHEEL_DIR), '--cache-dir', str(PIP_CACHE),
+    ]
+    for pip_platform in python_info["pip_platforms"]:
+        download_args += ['--platform', pip_platform]
+
+    if not run_host_pip(download_args):
+        print(f"⚠️  Auflösung für {platform} fehlgeschlagen, pip installiert online")
+        return False
+
+    shutil.copyfile(requirements, deps_dir / ".requirements")
+    print(f"✅ Dependencies für {platform} aufgelöst")
+    return True
+
+
+def prepare_wheelhouse():
+    """Baut einmalig Wheels für alle Requirements mit dem Host-Python
+
+    Die Wheels dienen den Plattform-Builds als lokale Quelle (--find-links).
+    Reine Python-Pakete passen auf jede Plattform; für alles andere fällt pip
+    auf PyPI bzw. den pip-Cache zurück. Ein Fehler hier ist daher nicht fatal.
+    """
+    print("\n🛞 Baue Wheels für Requirements vor...")
+    requirements = runtime_requirements()
+    WHEEL_DIR.mkdir(parents=True, exist_ok=True)
+
+    wheel_args = [
+        'wheel', '-r', str(requirements),
+        '-w', str(WHEEL_DIR), '--cache-dir', str(PIP_CACHE), '--prefer-binary',
+    ]
+    if not run_host_pip(wheel_args):
+        print("⚠️  Wheels konnten nicht vollständig gebaut werden, pip lädt fehlende Pakete nach")
+        return False
+
+    print(f"✅ Wheels bereit in {WHEEL_DIR.name}")
+    return True
+
+
 def create_startup_script_windows(platform_dir: Path):
     """Erstellt Startup-Skript für Windows mit embedded Python"""
     script_content = '''@echo off
@@ -408,10 +949,11 @@ def clean_build_dirs():
     print("🧹 Räume alte Embedded-Standalone-Builds auf...")
 
     # Lösche nur die embedded-standalone-spezifischen Build-Ordner
+    # (ohne --force bleiben sie für die Fortsetzung erhalten)
     for platform in ["windows", "macos", "linux"]:
         # Dieses Skript erstellt: MGBFreizeitplaner-{platform}-standalone
         embedded_build_dir = BUILD_DIR / f"MGBFreizeitplaner-{platform}-standalone"
-        if embedded_build_dir.exists():
+        if FORCE_REBUILD and embedded_build_dir.exists():
             shutil.rmtree(embedded_build_dir)
             print(f"  ✓ Entfernt: {embedded_build_dir.name}")
 
@@ -419,22 +961,47 @@ def clean_build_dirs():
     # (nicht die Windows-Standalone vom anderen Skript, die hat großes W im Ordnernamen)
     if RELEASE_DIR.exists():
         for platform in ["windows", "macos", "linux"]:
-            for release_file in RELEASE_DIR.glob(f"MGBFreizeitplaner-*-{platform}-standalone-*.zip"):
-                release_file.unlink()
-                print(f"  ✓ Entfernt: {release_file.name}")
+            for extension in ("zip", "tar.zst"):
+                for release_file in RELEASE_DIR.glob(f"MGBFreizeitplaner-*-{platform}-standalone-*.{extension}"):
+                    release_file.unlink()
+                    print(f"  ✓ Entfernt: {release_file.name}")
 
     # Erstelle Verzeichnisse falls nicht vorhanden
     BUILD_DIR.mkdir(parents=True, exist_ok=True)
     RELEASE_DIR.mkdir(parents=True, exist_ok=True)
     DOWNLOAD_CACHE.mkdir(parents=True, exist_ok=True)
+    DEPS_DIR.mkdir(parents=True, exist_ok=True)
 
     print("✅ Aufgeräumt!")
 
 
-def copy_project_files(target_dir: Path):
-    """Kopiert Projektdateien in Zielverzeichnis"""
+def _link_or_copy(source, dest):
+    """Legt einen Hardlink an, über Dateisystemgrenzen hinweg eine Kopie"""
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
+    return dest
+
+
+def copy_project_files(target_dir: Path, manifest: list = None):
+    """Kopiert Projektdateien in Zielverzeichnis
+
+    Ist manifest angegeben, werden die kopierten Dateien dort als
+    (Dateipfad, Archivname) eingetragen - die Archive müssen diese Ordner
+    dann nicht erneut durchlaufen.
+    """
     print(f"📋 Kopiere Projektdateien nach {target_dir.name}...")
 
+    prefix_len = len(str(target_dir.parent)) + 1
+
+    def copy_and_record(source, dest):
+        _link_or_copy(source, dest)
+        if manifest is not None:
+            dest = str(dest)
+            manifest.append((dest, dest[prefix_len:]))
+        return dest
+
     for item in INCLUDE_ITEMS:
         source = PROJECT_ROOT / item
         if not source.exists():
@@ -444,14 +1011,132 @@ def copy_project_files(target_dir: Path):
         dest = target_dir / item
 
         if source.is_dir():
-            shutil.copytree(source, dest, dirs_exist_ok=True)
+            # Bei fortgesetzten Builds keine gelöschten Dateien mitschleppen
+            if dest.exists():
+                shutil.rmtree(dest)
+            # Hardlinks statt Kopien: die Dateien werden im Build nicht verändert
+            shutil.copytree(source, dest, dirs_exist_ok=True,
+                            ignore=COPY_IGNORE, copy_function=copy_and_record)
             print(f"  ✓ {item}")
         else:
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            dest.unlink(missing_ok=True)
+            copy_and_record(source, dest)
             print(f"  ✓ {item}")
 
 
+def iter_package_files(platform_dir: Path, manifest: list = ()):
+    """Liefert (Dateipfad, Archivname) für alle zu packenden Dateien
+
+    Einträge aus dem Kopier-Manifest werden direkt übernommen, durchlaufen
+    wird nur der Rest (Python, Dependencies, generierte Dateien).
+    """
+    yield from manifest
+    listed = {arcname for _, arcname in manifest}
+    copied_dirs = {item.rstrip("/") for item in INCLUDE_ITEMS if item.endswith("/")} if manifest else set()
+
+    # Archivname per String-Slicing statt Path.relative_to (tausende Dateien)
+    build_prefix_len = len(str(BUILD_DIR)) + 1
+    top_level = str(platform_dir)
+    for root, dirs, files in os.walk(platform_dir):
+        # Überspringe Cache-Dateien und bereits erfasste Projektordner
+        dirs[:] = [
+            d for d in dirs
+            if d not in SKIP_DIRS and not (root == top_level and d in copied_dirs)
+        ]
+
+        for file in files:
+            if file.endswith('.pyc'):
+                continue
+            if root == top_level and file in BUILD_MARKERS:
+                continue
+
+            file_path = os.path.join(root, file)
+            arcname = file_path[build_prefix_len:]
+            if arcname not in listed:
+                yield file_path, arcname
+
+
+def _deflate_file(file_path: str):
+    """Liest und komprimiert eine Datei als rohen Deflate-Stream (wie im ZIP)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    compressor = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    return zlib.crc32(data), len(data), compressor.compress(data) + compressor.flush()
+
+
+def create_zip_parallel(files: list, zip_path: Path):
+    """Erstellt das ZIP-Archiv, die Dateien werden parallel komprimiert
+
+    zlib gibt beim Komprimieren den GIL frei, daher reichen Threads. Die
+    fertigen Deflate-Daten werden anschließend der Reihe nach ins Archiv
+    geschrieben (siehe ZIP_INTERNALS_SUPPORTED).
+    """
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                         compresslevel=ZIP_COMPRESS_LEVEL, strict_timestamps=False) as zipf:
+        if not ZIP_INTERNALS_SUPPORTED:
+            for file_path, arcname in files:
+                zipf.write(file_path, arcname)
+            return
+        _write_deflated_entries(zipf, files)
+
+
+def _write_deflated_entries(zipf: zipfile.ZipFile, files: list):
+    """Komprimiert parallel und hängt die Einträge über die ZipFile-Interna an"""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_deflate_file, [file_path for file_path, _ in files])
+        for (file_path, arcname), (crc, file_size, data) in zip(files, results):
+            # Zeitstempel vor 1980 (z.B. aus Wheels) klemmen statt abbrechen
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.CRC = crc
+            zinfo.file_size = file_size
+            zinfo.compress_size = len(data)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf.fp.write(zinfo.FileHeader())
+            zipf.fp.write(data)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[arcname] = zinfo
+        # Zentralverzeichnis beginnt hinter dem letzten Eintrag
+        zipf.start_dir = zipf.fp.tell()
+
+
+def create_tar_zst(files: list, archive_path: Path) -> bool:
+    """Erstellt ein .tar.zst-Archiv (benötigt das Paket zstandard)"""
+    try:
+        import tarfile
+        import zstandard
+    except ImportError:
+        print("⚠️  zstandard nicht installiert, erstelle nur ZIP-Archiv")
+        return False
+
+    print(f"\n🗜️  Erstelle tar.zst-Archiv: {archive_path.name}")
+    # threads=-1: alle CPU-Kerne; Tar wird direkt in den Kompressor gestreamt
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    with open(archive_path, 'wb') as raw:
+        with compressor.stream_writer(raw) as compressed:
+            with tarfile.open(fileobj=compressed, mode='w|') as tar:
+                for file_path, arcname in files:
+                    tar.add(file_path, arcname, recursive=False)
+
+    size_mb = archive_path.stat().st_size / (1024 * 1024)
+    print(f"✅ {archive_path.name} erstellt ({size_mb:.1f} MB)")
+    return True
+
+
+def check_disk_space(platforms: list) -> bool:
+    """Prüft vor dem Build, ob genug freier Speicher vorhanden ist"""
+    required_mb = sum(
+        PYTHON_VERSIONS[platform]["size_mb"] + EXTRA_SPACE_MB_PER_PLATFORM
+        for platform in platforms
+    )
+    free_mb = shutil.disk_usage(PROJECT_ROOT).free / (1024 * 1024)
+    if free_mb < required_mb:
+        print(f"❌ Zu wenig Speicherplatz: ~{required_mb} MB benötigt, {free_mb:.0f} MB frei")
+        return False
+    return True
+
+
 def create_platform_package(platform: str) -> Path:
     """Erstellt vollständiges Standalone-Paket für eine Plattform"""
     print(f"\n{'='*60}")
@@ -463,19 +1148,37 @@ def create_platform_package(platform: str) -> Path:
     platform_dir.mkdir(parents=True, exist_ok=True)
 
     # 1. Kopiere Projektdateien
-    copy_project_files(platform_dir)
+    manifest = []
+    copy_project_files(platform_dir, manifest)
 
     # 2. Setup embedded Python
-    if platform == "windows":
-        if not setup_embedded_python_windows(platform_dir):
-            raise Exception("Embedded Python Setup für Windows fehlgeschlagen")
+    python_marker = platform_dir / PYTHON_SETUP_MARKER
+    if python_marker.exists():
+        print("\n✅ Python bereits eingerichtet (aus vorherigem Build)")
     else:
-        if not setup_embedded_python_unix(platform_dir, platform):
-            raise Exception(f"Embedded Python Setup für {platform} fehlgeschlagen")
+        # Reste eines abgebrochenen Setups entfernen, Dependencies neu installieren
+        shutil.rmtree(platform_dir / "python", ignore_errors=True)
+        (platform_dir / DEPS_INSTALLED_MARKER).unlink(missing_ok=True)
+        if platform == "windows":
+            if not setup_embedded_python_windows(platform_dir):
+                raise Exception("Embedded Python Setup für Windows fehlgeschlagen")
+        else:
+            if not setup_embedded_python_unix(platform_dir, platform):
+                raise Exception(f"Embedded Python Setup für {platform} fehlgeschlagen")
+        python_marker.touch()
+
+    # 3. Installiere Dependencies (erneut, sobald sich requirements.txt ändert)
+    deps_marker = platform_dir / DEPS_INSTALLED_MARKER
+    requirements = (PROJECT_ROOT / "requirements.txt").read_bytes()
+    if deps_marker.exists() and deps_marker.read_bytes() == requirements:
+        print("\n✅ Dependencies bereits installiert (aus vorherigem Build)")
+    else:
+        if not install_dependencies(platform_dir, platform):
+            raise Exception("Dependency-Installation fehlgeschlagen")
+        deps_marker.write_bytes(requirements)
 
-    # 3. Installiere Dependencies
-    if not install_dependencies(platform_dir, platform):
-        raise Exception("Dependency-Installation fehlgeschlagen")
+    # Bytecode schon beim Build erzeugen (schnellerer erster Start)
+    compile_bytecode(platform_dir, platform, manifest)
 
     # 4. Erstelle Startup-Skript
     if platform == "windows":
@@ -506,6 +1209,7 @@ Einfach entpacken und starten!
 - Größe: ~{PYTHON_VERSIONS[platform]['size_mb'] + 20} MB
 - Portable: Kann auf USB-Stick verwendet werden
 - Datenbank: Wird lokal im Ordner gespeichert
+- Vorkompiliert: `app/` und die Dependencies enthalten bereits Bytecode (`__pycache__`), der Start ist dadurch schneller
 
 ## Support
 
@@ -515,24 +1219,21 @@ Bei Problemen: https://github.com/[YOUR_REPO]/issues
     readme_path = platform_dir / "README_STANDALONE.md"
     readme_path.write_text(readme_content, encoding='utf-8')
 
-    # 6. Erstelle ZIP-Archiv
+    # 6. Erstelle Archive
     timestamp = datetime.now().strftime("%Y%m%d")
-    zip_name = f"MGBFreizeitplaner-{VERSION}-{platform}-standalone-{timestamp}.zip"
-    zip_path = RELEASE_DIR / zip_name
+    archive_base = f"MGBFreizeitplaner-{VERSION}-{platform}-standalone-{timestamp}"
+    files = list(iter_package_files(platform_dir, manifest))
 
-    print(f"\n🗜️  Erstelle ZIP-Archiv: {zip_name}")
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(platform_dir):
-            # Überspringe Cache-Dateien
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', '.pytest_cache', '__pycache__']]
+    # macOS/Linux: .tar.zst als Haupt-Artefakt (kleiner, erhält Symlinks und Rechte)
+    if platform != "windows":
+        create_tar_zst(files, RELEASE_DIR / f"{archive_base}.tar.zst")
 
-            for file in files:
-                if file.endswith('.pyc'):
-                    continue
+    # ZIP für alle Plattformen (Windows-Explorer, ältere Systeme ohne zstd)
+    zip_name = f"{archive_base}.zip"
+    zip_path = RELEASE_DIR / zip_name
 
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(BUILD_DIR)
-                zipf.write(file_path, arcname)
+    print(f"\n🗜️  Erstelle ZIP-Archiv: {zip_name}")
+    create_zip_parallel(files, zip_path)
 
     # Dateigröße anzeigen
     size_mb = zip_path.stat().st_size / (1024 * 1024)
@@ -541,6 +1242,75 @@ Bei Problemen: https://github.com/[YOUR_REPO]/issues
     return zip_path
 
 
+class ThreadOutput(io.TextIOBase):
+    """Leitet print-Ausgaben einzelner Build-Threads in eigene Puffer um
+
+    Threads ohne eigenen Puffer (z.B. der Haupt-Thread) schreiben weiterhin
+    direkt in den ursprünglichen Stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def start_capture(self):
+        self._local.buffer = io.StringIO()
+
+    def stop_capture(self) -> str:
+        buffer = self._local.buffer
+        self._local.buffer = None
+        return buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def build_platforms_parallel(platforms: list) -> list:
+    """Baut mehrere Plattform-Pakete parallel (Downloads, Entpacken und pip sind I/O-gebunden)
+
+    Die Ausgabe jeder Plattform wird gepuffert und nach Abschluss am Stück ausgegeben.
+    """
+    output = ThreadOutput(sys.stdout)
+    print_lock = threading.Lock()
+
+    def build(platform):
+        output.start_capture()
+        try:
+            return create_platform_package(platform)
+        except Exception as e:
+            print(f"\n❌ Fehler beim Erstellen des {platform}-Pakets: {e}")
+            traceback.print_exc(file=sys.stdout)
+            return None
+        finally:
+            log = output.stop_capture()
+            with print_lock:
+                output.stream.write(log)
+                output.stream.flush()
+
+    print(f"⏳ Baue {len(platforms)} Plattformen parallel, Ausgaben folgen je Plattform nach Abschluss...")
+
+    created_packages = []
+    original_stdout = sys.stdout
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = {executor.submit(build, platform): platform for platform in platforms}
+            for future in as_completed(futures):
+                zip_path = future.result()
+                if zip_path:
+                    created_packages.append((futures[future], zip_path))
+    finally:
+        sys.stdout = original_stdout
+
+    # Reihenfolge der Auswahl beibehalten
+    created_packages.sort(key=lambda item: platforms.index(item[0]))
+    return created_packages
+
+
 def create_all_packages():
     """Erstellt Standalone-Pakete für alle Plattformen"""
     print("\n" + "="*60)
@@ -575,16 +1345,27 @@ def create_all_packages():
 
     print(f"\n✅ Erstelle Pakete für: {', '.join(selected_platforms)}\n")
 
-    # Erstelle Pakete
-    created_packages = []
+    if not check_disk_space(selected_platforms):
+        return
+
+    # Wheels einmal vorab bauen, alle Plattformen greifen darauf zu
+    prepare_wheelhouse()
+    # Auflösung läuft im Prozess (pip), daher vor den parallelen Builds
     for platform in selected_platforms:
-        try:
-            zip_path = create_platform_package(platform)
-            created_packages.append((platform, zip_path))
-        except Exception as e:
-            print(f"\n❌ Fehler beim Erstellen des {platform}-Pakets: {e}")
-            import traceback
-            traceback.print_exc()
+        resolve_dependencies(platform)
+
+    # Erstelle Pakete (mehrere Plattformen parallel)
+    created_packages = []
+    if len(selected_platforms) > 1:
+        created_packages = build_platforms_parallel(selected_platforms)
+    else:
+        for platform in selected_platforms:
+            try:
+                zip_path = create_platform_package(platform)
+                created_packages.append((platform, zip_path))
+            except Exception as e:
+                print(f"\n❌ Fehler beim Erstellen des {platform}-Pakets: {e}")
+                traceback.print_exc()
 
     # Zusammenfassung
     print("\n" + "="*60)
@@ -597,7 +1378,7 @@ def create_all_packages():
         print(f"  ✓ {platform.upper()}: {zip_path.name} ({size_mb:.1f} MB)")
 
     print("\n💡 Nächste Schritte:")
-    print("  1. Teste die ZIP-Archive auf den jeweiligen Plattformen")
+    print("  1. Teste die Archive (ZIP bzw. tar.zst) auf den jeweiligen Plattformen")
     print("  2. WICHTIG: Einfach entpacken und start_embedded Skript ausführen!")
     print("  3. Lade sie auf GitHub Releases hoch")
     print("  4. Aktualisiere die README mit Download-Links")
@@ -612,6 +1393,7 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Kritischer Fehler: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        close_http_client()
@@ -6,15 +6,22 @@ Erstellt vollständig eigenständige ZIP-Archive mit embedded Python für Window
 KEINE Python-Installation erforderlich!
 
 Für macOS/Linux: Verwende die Portable-Version (build_portable.py)
+
+Optionen:
+    --release   Maximale Kompression (Stufe 9) für zu veröffentlichende Archive
 """
 
 import os
+import re
 import sys
 import shutil
 import zipfile
+import zlib
 import urllib.request
 import ssl
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -34,7 +41,66 @@ except Exception:
 # Python Version für Windows
 PYTHON_VERSION = "3.11.9"
 PYTHON_URL = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/python-{PYTHON_VERSION}-embed-amd64.zip"
-PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
+
+# pip läuft direkt aus dem Wheel im Download-Cache - kein get-pip.py-Bootstrap
+PIP_VERSION = "24.2"
+PIP_WHEEL_NAME = f"pip-{PIP_VERSION}-py3-none-any.whl"
+PIP_URL = f"https://files.pythonhosted.org/packages/py3/p/pip/{PIP_WHEEL_NAME}"
+PIP_WHEEL_CACHE = DOWNLOAD_CACHE / PIP_WHEEL_NAME
+# Der ._pth-Modus ignoriert PYTHONPATH, daher wird das Wheel per -c eingehängt
+PIP_RUNNER = (
+    "import sys, runpy; sys.path.insert(0, sys.argv.pop(1)); "
+    "runpy.run_module('pip', run_name='__main__', alter_sys=True)"
+)
+
+# Wheels für win_amd64 / Python 3.11, einmal geladen und offline installiert
+WHEEL_CACHE = DOWNLOAD_CACHE / "wheels"
+WHEEL_STAMP = WHEEL_CACHE / ".stamp"
+# Mit dem Host-Python gebaute Wheels für Pakete, die es nur als sdist gibt
+HOST_WHEEL_CACHE = DOWNLOAD_CACHE / "host_wheels"
+RUNTIME_REQUIREMENTS = WHEEL_CACHE / "requirements-runtime.txt"
+
+# Build-Werkzeuge aus requirements.txt, die nicht ins embedded Python gehören
+# (Nuitka und seine Helfer; nuitka gibt es auf PyPI nur als sdist)
+BUILD_ONLY_PACKAGES = frozenset(("nuitka", "ordered-set", "pefile"))
+_REQUIREMENT_NAME = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# Downloads: 1 MiB Lesepuffer, Fortschritt höchstens alle 0,1 s, ein SSL-Kontext für alle
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 0.1
+SSL_CONTEXT = ssl.create_default_context()
+
+# Deflate-Stufe: 1 für schnelle Test-Builds, 9 mit --release
+ZIP_COMPRESS_LEVEL = 9 if "--release" in sys.argv else 1
+
+# create_zip_parallel schreibt vorab komprimierte Einträge direkt über die
+# privaten ZipFile-Felder fp, start_dir, filelist und NameToInfo (an
+# _writecheck() und _lock vorbei). Getestet mit CPython 3.11, 3.12 und 3.13;
+# andere Versionen nehmen den langsameren Weg über ZipFile.writestr()
+ZIP_INTERNALS_SUPPORTED = (
+    sys.implementation.name == "cpython" and (3, 11) <= sys.version_info[:2] <= (3, 13)
+)
+
+# Einheitlicher Zeitstempel aller ZIP-Einträge: reproduzierbare Archive,
+# kein stat()/localtime() pro Datei
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_ATTR = 0o100644 << 16
+
+# Bereits komprimierte Formate - Deflate bringt hier nichts, nur CPU-Zeit
+STORED_EXTENSIONS = frozenset((
+    'zip', 'whl', 'gz', 'png', 'jpg', 'jpeg', 'gif', 'webp', 'woff', 'woff2',
+))
+
+# Teile der Python-Distribution, die die FastAPI-App nicht braucht
+# (Tcl/Tk, IDLE, Testsuiten) - werden vor dem Packen entfernt, falls vorhanden
+PRUNE_PYTHON_DIRS = (
+    "tcl", "Lib/tkinter", "Lib/idlelib", "Lib/turtledemo", "Lib/test",
+    "Lib/unittest/test", "Lib/distutils/tests", "Lib/lib2to3/tests",
+)
+PRUNE_PYTHON_GLOBS = ("DLLs/tcl*.dll", "DLLs/tk*.dll", "DLLs/_tkinter.pyd", "*.pdb")
+
+# Verzeichnisse, die weder kopiert noch gepackt werden
+SKIP_DIRS = frozenset(('__pycache__', '.pytest_cache'))
 
 # Dateien die inkludiert werden sollen
 INCLUDE_ITEMS = [
@@ -54,48 +120,89 @@ def download_file(url: str, destination: Path, description: str = "Datei"):
 
     destination.parent.mkdir(parents=True, exist_ok=True)
 
-    ssl_context = ssl.create_default_context()
     headers = {'User-Agent': 'Mozilla/5.0'}
     request = urllib.request.Request(url, headers=headers)
+    # Erst nach vollständigem Download umbenennen: ein abgebrochener Download
+    # hinterlässt keine (vorab auf Endgröße reservierte) Datei, die die
+    # exists()-Prüfungen des Caches später für gültig halten
+    part_file = destination.with_name(destination.name + ".part")
 
     try:
-        with urllib.request.urlopen(request, context=ssl_context) as response:
+        with urllib.request.urlopen(request, context=SSL_CONTEXT) as response:
             total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
             downloaded = 0
+            last_print = 0.0
+
+            with open(part_file, 'wb') as f:
+                # Endgröße vorab reservieren (weniger Fragmentierung)
+                if total_size > 0:
+                    f.truncate(total_size)
 
-            with open(destination, 'wb') as f:
                 while True:
-                    buffer = response.read(block_size)
+                    buffer = response.read(DOWNLOAD_BLOCK_SIZE)
                     if not buffer:
                         break
 
                     downloaded += len(buffer)
                     f.write(buffer)
 
-                    if total_size > 0:
+                    # Fortschritt zeitbasiert drosseln - jede Konsolenausgabe kostet unter Windows
+                    now = time.monotonic()
+                    if total_size > 0 and (now - last_print >= PROGRESS_INTERVAL or downloaded == total_size):
+                        last_print = now
                         percent = (downloaded / total_size) * 100
                         mb_downloaded = downloaded / (1024 * 1024)
                         mb_total = total_size / (1024 * 1024)
-                        print(f"\r   Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end='')
+                        # Feste Breite, damit die Zeile sauber überschrieben wird
+                        sys.stdout.write(f"\r   Progress: {percent:5.1f}% ({mb_downloaded:6.1f}/{mb_total:.1f} MB)")
+                        sys.stdout.flush()
+
+                # Bei abgebrochener Verbindung keine Nullbytes am Ende stehen lassen
+                f.truncate()
 
+            if total_size > 0 and downloaded != total_size:
+                raise OSError(f"Unvollständiger Download ({downloaded} von {total_size} Bytes)")
+
+        os.replace(part_file, destination)
         print()
         print(f"✅ Download abgeschlossen: {destination.name}")
         return True
 
     except Exception as e:
+        part_file.unlink(missing_ok=True)
         print(f"\n❌ Fehler beim Download: {e}")
         return False
 
 
 def extract_zip(zip_path: Path, destination: Path):
-    """Entpackt ein ZIP-Archiv"""
+    """Entpackt ein ZIP-Archiv
+
+    Statt extractall() wird jeder Eintrag direkt mit 1 MiB-Blöcken
+    geschrieben - das Embed-ZIP besteht aus Hunderten kleiner Dateien.
+    """
     print(f"📦 Entpacke {zip_path.name}...")
     destination.mkdir(parents=True, exist_ok=True)
 
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(destination)
+            created_dirs = {destination}
+            for info in zip_ref.infolist():
+                member = Path(info.filename)
+                if member.is_absolute() or ".." in member.parts:
+                    raise ValueError(f"Unzulässiger Pfad im Archiv: {info.filename}")
+
+                target = destination / member
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target)
+                    continue
+
+                if target.parent not in created_dirs:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target.parent)
+
+                with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, DOWNLOAD_BLOCK_SIZE)
         print(f"✅ Entpackt nach: {destination}")
         return True
     except Exception as e:
@@ -122,10 +229,12 @@ def setup_embedded_python(platform_dir: Path) -> bool:
     if not extract_zip(cache_file, python_dir):
         return False
 
-    # Download get-pip.py
-    pip_installer = python_dir / "get-pip.py"
-    if not download_file(PIP_URL, pip_installer, "pip installer"):
-        return False
+    # pip-Wheel wird im Download-Cache gehalten und direkt daraus ausgeführt
+    if not PIP_WHEEL_CACHE.exists():
+        if not download_file(PIP_URL, PIP_WHEEL_CACHE, f"pip {PIP_VERSION}"):
+            return False
+    else:
+        print(f"✅ Verwende gecachte Datei: {PIP_WHEEL_CACHE.name}")
 
     # Aktiviere site-packages und füge Parent-Directory hinzu
     pth_files = list(python_dir.glob("python*._pth"))
@@ -149,6 +258,69 @@ def setup_embedded_python(platform_dir: Path) -> bool:
     return True
 
 
+def download_wheels(requirements: Path) -> bool:
+    """Lädt die Wheels für Windows einmalig in den Download-Cache
+
+    Läuft mit dem Host-Python. Solange requirements.txt nicht neuer als der
+    Stempel ist, wird der Cache ohne Netzwerkzugriff wiederverwendet.
+    """
+    if WHEEL_STAMP.exists() and WHEEL_STAMP.stat().st_mtime >= requirements.stat().st_mtime:
+        print("  ✓ Verwende gecachte Wheels")
+        return True
+
+    print("  Downloading wheels...")
+    WHEEL_CACHE.mkdir(parents=True, exist_ok=True)
+    # Ohne Build-Werkzeuge: --platform verlangt --only-binary, nuitka hat kein Wheel
+    runtime = runtime_requirements(requirements)
+
+    # sdist-only Pakete (z.B. proxy_tools) einmal mit dem Host-Python zu
+    # reinen Python-Wheels bauen, pip download findet sie per --find-links
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "wheel", "-r", str(runtime),
+         "-w", str(HOST_WHEEL_CACHE), "--prefer-binary",
+         "--disable-pip-version-check"],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode == 0:
+        python_tag = "".join(PYTHON_VERSION.split(".")[:2])
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "download", "-r", str(runtime),
+             "-d", str(WHEEL_CACHE), "--platform", "win_amd64",
+             "--python-version", python_tag, "--only-binary=:all:",
+             "--find-links", str(HOST_WHEEL_CACHE),
+             "--disable-pip-version-check"],
+            capture_output=True,
+            text=True
+        )
+
+    if result.returncode != 0:
+        print("  ⚠️  Wheels konnten nicht vorab geladen werden, installiere online")
+        print(f"STDERR: {result.stderr}")
+        return False
+
+    WHEEL_STAMP.touch()
+    print("  ✓ Wheels im Cache")
+    return True
+
+
+def runtime_requirements(requirements: Path) -> Path:
+    """Schreibt requirements.txt ohne BUILD_ONLY_PACKAGES in den Wheel-Cache und gibt den Pfad zurück"""
+    lines = []
+    for line in requirements.read_text(encoding="utf-8").splitlines():
+        match = _REQUIREMENT_NAME.match(line)
+        if match and re.sub(r'[._-]+', '-', match.group(1)).lower() in BUILD_ONLY_PACKAGES:
+            continue
+        lines.append(line)
+    content = "\n".join(lines) + "\n"
+
+    if not RUNTIME_REQUIREMENTS.exists() or RUNTIME_REQUIREMENTS.read_text(encoding="utf-8") != content:
+        WHEEL_CACHE.mkdir(parents=True, exist_ok=True)
+        RUNTIME_REQUIREMENTS.write_text(content, encoding="utf-8")
+    return RUNTIME_REQUIREMENTS
+
+
 def install_dependencies(platform_dir: Path) -> bool:
     """Installiert Python-Dependencies"""
     print(f"\n📦 Installiere Dependencies...")
@@ -160,50 +332,45 @@ def install_dependencies(platform_dir: Path) -> bool:
     # Konvertiere zu absoluten Pfaden
     python_exe = python_exe.absolute()
     requirements = requirements.absolute()
-    get_pip = (python_dir / "get-pip.py").absolute()
+    pip_wheel = PIP_WHEEL_CACHE.absolute()
 
     # Prüfe ob Dateien existieren
     if not python_exe.exists():
         print(f"❌ Python nicht gefunden: {python_exe}")
         return False
 
-    if not get_pip.exists():
-        print(f"❌ get-pip.py nicht gefunden: {get_pip}")
+    if not pip_wheel.exists():
+        print(f"❌ pip-Wheel nicht gefunden: {pip_wheel}")
         return False
 
     if not requirements.exists():
         print(f"❌ requirements.txt nicht gefunden: {requirements}")
         return False
 
-    # Installiere pip
-    print("  Installing pip...")
-    try:
-        result = subprocess.run(
-            [str(python_exe), str(get_pip), "--no-warn-script-location"],
-            cwd=str(python_dir),
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            print(f"❌ Pip-Installation fehlgeschlagen")
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-            return False
-
-        print("  ✓ Pip installiert")
-    except Exception as e:
-        print(f"❌ Fehler bei pip-Installation: {e}")
-        return False
+    # Installiere Dependencies (offline aus dem Wheel-Cache, falls vorhanden)
+    # pip selbst wird nicht ins Paket installiert, sondern aus dem Wheel gestartet
+    # Ohne Build-Werkzeuge (nuitka hat kein Wheel und gehört nicht ins Paket)
+    pip_cmd = [
+        str(python_exe), "-c", PIP_RUNNER, str(pip_wheel),
+        "install", "-r", str(runtime_requirements(requirements).absolute()),
+        "--no-warn-script-location", "--disable-pip-version-check",
+        # Bytecode würde ohnehin nicht ins ZIP übernommen
+        "--no-compile",
+        # Wheels bevorzugen; reine Python-Pakete ohne Wheel (proxy_tools) als sdist
+        "--prefer-binary",
+    ]
+    if download_wheels(requirements):
+        pip_cmd += ["--no-index", "--find-links", str(WHEEL_CACHE.absolute())]
 
-    # Installiere Dependencies
     print(f"  Installing requirements...")
     try:
         result = subprocess.run(
-            [str(python_exe), "-m", "pip", "install", "-r", str(requirements), "--no-warn-script-location"],
+            pip_cmd,
             cwd=str(platform_dir),
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
             capture_output=True,
-            text=True
+            text=True,
+            bufsize=64 * 1024
         )
 
         if result.returncode != 0:
@@ -217,29 +384,95 @@ def install_dependencies(platform_dir: Path) -> bool:
         print(f"❌ Fehler bei Dependency-Installation: {e}")
         return False
 
+    # Bytecode-Reste entfernen, bevor das ZIP gebaut wird
+    prune_bytecode(python_dir / "Lib" / "site-packages")
+
     print("✅ Dependencies installiert")
     return True
 
 
-def copy_project_files(target_dir: Path):
-    """Kopiert Projektdateien"""
-    print(f"📋 Kopiere Projektdateien...")
-
+def prune_bytecode(directory: Path):
+    """Löscht __pycache__-Ordner und .pyc/.pyo-Dateien unterhalb von directory"""
+    if not directory.exists():
+        return
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    shutil.rmtree(entry.path)
+                else:
+                    prune_bytecode(Path(entry.path))
+            elif entry.name.endswith(('.pyc', '.pyo')):
+                os.unlink(entry.path)
+
+
+def prune_python_dist(python_dir: Path):
+    """Entfernt ungenutzte Teile der Python-Distribution vor dem Packen
+
+    Das Embeddable-Paket enthält die meisten davon gar nicht, nur ein
+    vollständiges Python bringt Tcl/Tk und Testsuiten mit. Zusätzlich
+    werden die RECORD-Dateien der installierten Pakete gelöscht - die
+    braucht nur pip zum Deinstallieren.
+    """
+    removed = 0
+    for rel in PRUNE_PYTHON_DIRS:
+        target = python_dir / rel
+        if target.is_dir():
+            shutil.rmtree(target)
+            removed += 1
+
+    for pattern in PRUNE_PYTHON_GLOBS:
+        for target in python_dir.glob(pattern):
+            target.unlink()
+            removed += 1
+
+    for record in (python_dir / "Lib" / "site-packages").glob("*.dist-info/RECORD"):
+        record.unlink()
+        removed += 1
+
+    print(f"  ✓ {removed} ungenutzte Einträge entfernt")
+
+
+def _scan_tree(src: str, arc_prefix: str, files: list):
+    """Sammelt Dateien eines Ordners per os.scandir (Stat-Ergebnisse aus DirEntry)
+
+    Cache-Dateien (__pycache__, *.pyc) werden übersprungen.
+    """
+    with os.scandir(src) as entries:
+        for entry in entries:
+            arcname = f"{arc_prefix}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    _scan_tree(entry.path, arcname, files)
+            elif not entry.name.endswith('.pyc'):
+                files.append((entry.path, arcname))
+
+
+def collect_project_files(platform_dir: Path) -> list:
+    """Sammelt die Projektdateien als (Dateipfad, Archivname)
+
+    Die Dateien werden nicht nach build/ kopiert, sondern beim Packen
+    direkt aus dem Projektverzeichnis ins ZIP geschrieben.
+    """
+    print(f"📋 Sammle Projektdateien...")
+
+    files = []
     for item in INCLUDE_ITEMS:
         source = PROJECT_ROOT / item
         if not source.exists():
             print(f"⚠️  Warnung: {item} nicht gefunden")
             continue
 
-        dest = target_dir / item
-
+        arcname = f"{platform_dir.name}/{item.rstrip('/')}"
         if source.is_dir():
-            shutil.copytree(source, dest, dirs_exist_ok=True)
+            _scan_tree(str(source), arcname, files)
         else:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            files.append((str(source), arcname))
         print(f"  ✓ {item}")
 
+    return files
+
 
 def create_startup_script(platform_dir: Path):
     """Erstellt Startup-Skript"""
@@ -383,6 +616,83 @@ def clean_standalone_windows_files():
     print("✅ Aufgeräumt!\n")
 
 
+def _zip_info(arcname: str) -> zipfile.ZipInfo:
+    """ZIP-Eintrag mit einheitlichem Zeitstempel und Dateirechten"""
+    zinfo = zipfile.ZipInfo(arcname, ZIP_DATE_TIME)
+    zinfo.external_attr = ZIP_FILE_ATTR
+    return zinfo
+
+
+def _compress_type(file_path: str) -> int:
+    """Bereits komprimierte Formate werden unverändert gespeichert (ZIP_STORED)"""
+    if file_path.rpartition('.')[2].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _compress_file(file_path: str):
+    """Liest eine Datei und komprimiert sie als rohen Deflate-Stream (wie im ZIP)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if _compress_type(file_path) == zipfile.ZIP_STORED:
+        return zipfile.ZIP_STORED, zlib.crc32(data), len(data), data
+    compressor = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zipfile.ZIP_DEFLATED, zlib.crc32(data), len(data), compressed
+
+
+def create_zip_parallel(platform_dir: Path, zip_path: Path, project_files: list):
+    """Erstellt das ZIP-Archiv, die Dateien werden parallel komprimiert
+
+    zlib gibt beim Komprimieren den GIL frei, daher reichen Threads. Die
+    fertigen Deflate-Daten werden der Reihe nach ins Archiv geschrieben
+    (siehe ZIP_INTERNALS_SUPPORTED). Projektdateien kommen direkt aus dem
+    Projektverzeichnis.
+    """
+    # Build-Ordner einmal durchlaufen, Archivname per String-Slicing
+    build_prefix_len = len(str(BUILD_DIR)) + 1
+    files = list(project_files)
+    for root, dirs, filenames in os.walk(platform_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+        for file in filenames:
+            if file.endswith('.pyc'):
+                continue
+
+            file_path = os.path.join(root, file)
+            files.append((file_path, file_path[build_prefix_len:]))
+
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                         strict_timestamps=False) as zipf:
+        if not ZIP_INTERNALS_SUPPORTED:
+            for file_path, arcname in files:
+                with open(file_path, 'rb') as f:
+                    zipf.writestr(_zip_info(arcname), f.read(),
+                                  compress_type=_compress_type(file_path),
+                                  compresslevel=ZIP_COMPRESS_LEVEL)
+            return
+        _write_compressed_entries(zipf, files)
+
+
+def _write_compressed_entries(zipf: zipfile.ZipFile, files: list):
+    """Komprimiert parallel und hängt die Einträge über die ZipFile-Interna an"""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_compress_file, [file_path for file_path, _ in files])
+        for (file_path, arcname), (compress_type, crc, file_size, data) in zip(files, results):
+            zinfo = _zip_info(arcname)
+            zinfo.compress_type = compress_type
+            zinfo.CRC = crc
+            zinfo.file_size = file_size
+            zinfo.compress_size = len(data)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf.fp.write(zinfo.FileHeader())
+            zipf.fp.write(data)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[arcname] = zinfo
+        # Zentralverzeichnis beginnt hinter dem letzten Eintrag
+        zipf.start_dir = zipf.fp.tell()
+
+
 def create_package():
     """Erstellt Windows Standalone-Paket"""
     print("\n" + "="*60)
@@ -399,7 +709,7 @@ def create_package():
 
     # Build-Schritte
     try:
-        copy_project_files(platform_dir)
+        project_files = collect_project_files(platform_dir)
 
         if not setup_embedded_python(platform_dir):
             raise Exception("Python Setup fehlgeschlagen")
@@ -407,6 +717,8 @@ def create_package():
         if not install_dependencies(platform_dir):
             raise Exception("Dependency Installation fehlgeschlagen")
 
+        prune_python_dist(platform_dir / "python")
+
         create_startup_script(platform_dir)
         create_readme(platform_dir)
 
@@ -416,19 +728,9 @@ def create_package():
         zip_path = RELEASE_DIR / zip_name
 
         print(f"\n🗜️  Erstelle ZIP-Archiv: {zip_name}")
-        print("   Dies kann einige Minuten dauern...")
-
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(platform_dir):
-                dirs[:] = [d for d in dirs if d not in ['__pycache__', '.pytest_cache']]
-
-                for file in files:
-                    if file.endswith('.pyc'):
-                        continue
+        print(f"   Kompressionsstufe: {ZIP_COMPRESS_LEVEL}")
 
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(BUILD_DIR)
-                    zipf.write(file_path, arcname)
+        create_zip_parallel(platform_dir, zip_path, project_files)
 
         size_mb = zip_path.stat().st_size / (1024 * 1024)
 
@@ -29,62 +29,49 @@ def create_icon_with_pillow():
             use_cairosvg = False
             print("[INFO] cairosvg nicht verfügbar, erstelle einfaches Icon")
 
+        # Master-Bild einmal in 256x256 erzeugen, kleinere Größen werden
+        # per LANCZOS herunterskaliert statt jedes Mal neu zu rastern
+        master_size = 256
         if use_cairosvg:
-            # Konvertiere SVG zu PNG in verschiedenen Größen
-            sizes = [16, 32, 48, 64, 128, 256]
-            images = []
-
-            for size in sizes:
-                png_bytes = cairosvg.svg2png(
-                    bytestring=SVG_CONTENT.encode('utf-8'),
-                    output_width=size,
-                    output_height=size
-                )
-                img = Image.open(io.BytesIO(png_bytes))
-                images.append(img)
-
-            # Speichere als .ico
-            icon_path = Path(__file__).parent / "app_icon.ico"
-            images[0].save(
-                icon_path,
-                format='ICO',
-                sizes=[(img.width, img.height) for img in images],
-                append_images=images[1:]
+            png_bytes = cairosvg.svg2png(
+                bytestring=SVG_CONTENT.encode('utf-8'),
+                output_width=master_size,
+                output_height=master_size
             )
-            print(f"[OK] Icon erstellt: {icon_path}")
-            return str(icon_path)
+            master = Image.open(io.BytesIO(png_bytes)).convert('RGBA')
 
         else:
             # Fallback: Erstelle einfaches farbiges Icon ohne cairosvg
             from PIL import ImageDraw
 
-            sizes = [16, 32, 48, 64, 128, 256]
-            images = []
-
-            for size in sizes:
-                img = Image.new('RGBA', (size, size), (37, 99, 235, 255))  # Blue-600
-                draw = ImageDraw.Draw(img)
-
-                # Zeichne vereinfachtes Dreieck-Symbol
-                points = [
-                    (size // 2, size * 0.2),  # Top
-                    (size * 0.3, size * 0.8),  # Bottom left
-                    (size * 0.7, size * 0.8),  # Bottom right
-                ]
-                draw.polygon(points, fill=(255, 255, 255, 255))
-
-                images.append(img)
-
-            # Speichere als .ico
-            icon_path = Path(__file__).parent / "app_icon.ico"
-            images[0].save(
-                icon_path,
-                format='ICO',
-                sizes=[(img.width, img.height) for img in images],
-                append_images=images[1:]
-            )
-            print(f"[OK] Icon erstellt: {icon_path}")
-            return str(icon_path)
+            size = master_size
+            master = Image.new('RGBA', (size, size), (37, 99, 235, 255))  # Blue-600
+            draw = ImageDraw.Draw(master)
+
+            # Zeichne vereinfachtes Dreieck-Symbol
+            points = [
+                (size // 2, size * 0.2),  # Top
+                (size * 0.3, size * 0.8),  # Bottom left
+                (size * 0.7, size * 0.8),  # Bottom right
+            ]
+            draw.polygon(points, fill=(255, 255, 255, 255))
+
+        sizes = [16, 32, 48, 64, 128, 256]
+        images = [
+            master if size == master_size else master.resize((size, size), Image.LANCZOS)
+            for size in sizes
+        ]
+
+        # Speichere als .ico
+        icon_path = Path(__file__).parent / "app_icon.ico"
+        images[0].save(
+            icon_path,
+            format='ICO',
+            sizes=[(img.width, img.height) for img in images],
+            append_images=images[1:]
+        )
+        print(f"[OK] Icon erstellt: {icon_path}")
+        return str(icon_path)
 
     except ImportError as e:
         print(f"[FEHLER] Pillow nicht installiert: {e}")
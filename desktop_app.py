@@ -6,12 +6,9 @@ ohne dass ein externer Browser geöffnet werden muss.
 """
 import sys
 import os
-import platform
 from pathlib import Path
 
-import webview
 import threading
-import uvicorn
 import time
 import socket
 import logging
@@ -21,52 +18,92 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def find_free_port(start_port=8000, max_attempts=10):
-    """Findet einen freien Port, falls der Standard-Port belegt ist"""
-    for port in range(start_port, start_port + max_attempts):
+def bind_free_port(host='127.0.0.1', start_port=8000, max_attempts=10):
+    """Bindet einen Socket an den ersten freien Port und gibt ihn offen zurück
+
+    Der Socket wird direkt an Uvicorn übergeben - so kann zwischen Portsuche
+    und Serverstart kein anderes Programm den Port belegen. Bevorzugt werden
+    feste Ports (gleicher Origin, d.h. localStorage der WebView bleibt
+    erhalten); sind alle belegt, vergibt das Betriebssystem einen Port.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name == 'nt':
+        # Unter Windows erlaubt SO_REUSEADDR das Kapern belegter Ports -
+        # SO_EXCLUSIVEADDRUSE verhindert umgekehrt, dass uns jemand den Port kapert
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    # Ein fehlgeschlagenes bind() lässt den Socket ungebunden - derselbe Socket
+    # wird für den nächsten Port wiederverwendet
+    for port in list(range(start_port, start_port + max_attempts)) + [0]:
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('127.0.0.1', port))
-                return port
+            sock.bind((host, port))
+            return sock
         except OSError:
             continue
-    raise RuntimeError(f"Konnte keinen freien Port zwischen {start_port} und {start_port + max_attempts} finden")
+
+    sock.close()
+    raise RuntimeError("Konnte keinen freien Port finden")
+
+
+def create_notifying_server(config, ready):
+    """Erzeugt einen Uvicorn-Server, der nach dem Startup ein Event setzt"""
+    import uvicorn
+
+    class NotifyingServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            try:
+                await super().startup(sockets=sockets)
+            finally:
+                ready.set()
+
+    return NotifyingServer(config)
 
 
 class ServerThread(threading.Thread):
     """Thread für den FastAPI-Server"""
 
-    def __init__(self, host, port):
+    def __init__(self, sock):
         super().__init__(daemon=True)
-        self.host = host
-        self.port = port
+        self.sock = sock
+        self.host, self.port = sock.getsockname()[:2]
         self.server = None
-        self.started = threading.Event()
+        # Wird gesetzt, sobald der Server Anfragen annimmt (oder gescheitert ist)
+        self.ready = threading.Event()
 
     def run(self):
         """Startet den Uvicorn-Server"""
         try:
             logger.info(f"Starte FastAPI-Server auf {self.host}:{self.port}")
 
+            # Uvicorn erst im Server-Thread laden - das Fenster erscheint schneller
+            import uvicorn
+
             # Konfiguration für Uvicorn
+            # Kein Access-Log: die WebView erzeugt pro Seite viele Requests.
+            # loop/http "auto" nehmen uvloop bzw. httptools, sofern installiert.
             config = uvicorn.Config(
                 "app.main:app",
                 host=self.host,
                 port=self.port,
-                log_level="info",
-                access_log=True
+                log_level="warning",
+                access_log=False,
+                loop="auto",
+                http="auto",
+                interface="asgi3"
             )
-            self.server = uvicorn.Server(config)
-
-            # Signal dass Server bereit ist
-            self.started.set()
+            self.server = create_notifying_server(config, self.ready)
 
-            # Server starten (blockiert bis shutdown)
-            self.server.run()
+            # Server auf dem bereits gebundenen Socket starten (blockiert bis shutdown)
+            self.server.run(sockets=[self.sock])
 
         except Exception as e:
             logger.error(f"Fehler beim Starten des Servers: {e}", exc_info=True)
-            self.started.set()  # Auch bei Fehler signalisieren
+        finally:
+            # Auch bei Fehler signalisieren - Uvicorn beendet sich bei
+            # Importfehlern per sys.exit(), das fängt except Exception nicht
+            self.ready.set()
 
     def stop(self):
         """Stoppt den Server gracefully"""
@@ -75,40 +112,24 @@ class ServerThread(threading.Thread):
             self.server.should_exit = True
 
 
-def wait_for_server(host, port, timeout=30):
-    """Wartet bis der Server verfügbar ist"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                s.connect((host, port))
-                logger.info(f"Server ist verfügbar auf {host}:{port}")
-                return True
-        except (socket.timeout, ConnectionRefusedError, OSError):
-            time.sleep(0.5)
-    return False
-
-
 def on_closing():
     """Callback wenn das Fenster geschlossen wird"""
     logger.info("Anwendung wird beendet...")
     return True
 
 
-def start_server_and_redirect(window, host, port):
+def start_server_and_redirect(window, sock):
     """Startet den Server im Hintergrund und leitet dann zur App weiter"""
     # Server in separatem Thread starten
-    server_thread = ServerThread(host, port)
+    server_thread = ServerThread(sock)
     server_thread.start()
 
-    # Warten bis Server gestartet ist
-    server_thread.started.wait(timeout=5)
+    # Warten bis der Server-Startup abgeschlossen ist (kein Polling)
+    server_thread.ready.wait(timeout=60)
 
-    # Warten bis Server verfügbar ist
-    if wait_for_server(host, port, timeout=60):
-        logger.info("Server bereit - leite zur Anwendung weiter...")
-        window.load_url(f'http://{host}:{port}')
+    if server_thread.server and server_thread.server.started:
+        logger.info(f"Server bereit auf {server_thread.host}:{server_thread.port} - leite zur Anwendung weiter...")
+        window.load_url(f'http://{server_thread.host}:{server_thread.port}')
     else:
         logger.error("Server konnte nicht gestartet werden!")
         # Fehlermeldung im Fenster anzeigen
@@ -130,34 +151,41 @@ def main():
 
     # Arbeitsverzeichnis auf Projektroot setzen
     project_root = Path(__file__).parent
-    import os
-    os.chdir(project_root)
+    if "NUITKA_ONEFILE_PARENT" in os.environ:
+        # Onefile-Build: Code liegt im Entpack-Ordner, Datenbank und .env gehören neben die .exe
+        os.chdir(Path(sys.argv[0]).resolve().parent)
+    else:
+        os.chdir(project_root)
 
-    # Freien Port finden
+    # Freien Port finden und gleich gebunden halten
     try:
-        port = find_free_port()
-        host = "127.0.0.1"
-        logger.info(f"Verwende Port {port}")
+        sock = bind_free_port()
+        logger.info(f"Verwende Port {sock.getsockname()[1]}")
     except RuntimeError as e:
         logger.error(f"Fehler: {e}")
         sys.exit(1)
 
-    # Pfad zur Ladescreen-HTML
-    loading_screen = project_root / "app" / "static" / "loading.html"
+    # WebView erst hier laden (zieht unter Windows pythonnet/COM nach)
+    import webview
+
+    # Ladescreen-HTML direkt als String übergeben - die WebView muss für den
+    # ersten Paint keine file://-Navigation durchführen
+    loading_html = (project_root / "app" / "static" / "loading.html").read_text(encoding="utf-8")
 
     # Desktop-Fenster sofort mit Ladescreen erstellen und anzeigen
     logger.info("Öffne Desktop-Fenster mit Ladescreen...")
 
     window = webview.create_window(
         title='MGBFreizeitplaner - Freizeit-Kassen-System',
-        url=loading_screen.as_uri(),
+        html=loading_html,
         width=1400,
         height=900,
         resizable=True,
         frameless=False,
-        easy_drag=True,
         min_size=(800, 600),
-        text_select=True  # Ermöglicht Text-Markierung und Kopieren
+        # Ermöglicht Text-Markierung und Kopieren - ohne text_select würde
+        # pywebview in jede Seite CSS zum Sperren der Auswahl einfügen
+        text_select=True
     )
 
     # Event-Handler für Fenster-Schließen registrieren
@@ -168,7 +196,7 @@ def main():
 
     def on_loaded():
         """Callback wenn das Fenster geladen ist - startet Server im Hintergrund"""
-        server_thread_holder[0] = start_server_and_redirect(window, host, port)
+        server_thread_holder[0] = start_server_and_redirect(window, sock)
 
     # WebView starten - Server wird nach Fensteröffnung gestartet
     webview.start(on_loaded, debug=False)
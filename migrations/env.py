@@ -1,6 +1,7 @@
 """Alembic Environment Configuration"""
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy import event as sa_event  # "event" ist unten das Event-Model
 from alembic import context
 import sys
 from pathlib import Path
@@ -42,6 +43,16 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# SQLite-Tuning für Migrationen (pro Verbindung; journal_mode wird danach
+# wieder auf den ursprünglichen Wert zurückgesetzt)
+SQLITE_MIGRATION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",  # ~20 MB Page-Cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",  # 128 MB
+)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -90,12 +101,42 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
+    # SQLite: alle Migrationen eines Laufs in EINER Transaktion (ein Commit,
+    # ein fsync; bei Fehlern wird komplett zurückgerollt). pysqlite startet vor
+    # DDL-Statements selbst keine Transaktion, daher BEGIN explizit senden.
+    is_sqlite = connectable.dialect.name == "sqlite"
+    if is_sqlite:
+        @sa_event.listens_for(connectable, "connect")
+        def _disable_pysqlite_autobegin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+            cursor = dbapi_connection.cursor()
+            connection_record.info["journal_mode"] = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+            for pragma in SQLITE_MIGRATION_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+
+        @sa_event.listens_for(connectable, "checkin")
+        def _restore_journal_mode(dbapi_connection, connection_record):
+            journal_mode = connection_record.info.pop("journal_mode", None)
+            if journal_mode and journal_mode.lower() != "wal":
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+                cursor.close()
+
+        @sa_event.listens_for(connectable, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            # Alembic behandelt SQLite sonst als nicht-transaktional (Commit pro Migration)
+            transactional_ddl=True if is_sqlite else None,
         )
 
         with context.begin_transaction():
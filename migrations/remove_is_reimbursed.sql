@@ -50,3 +50,6 @@ ALTER TABLE expenses_new RENAME TO expenses;
 -- 5. Recreate indexes if any existed
 CREATE INDEX IF NOT EXISTS idx_expenses_event_id ON expenses(event_id);
 CREATE INDEX IF NOT EXISTS idx_expenses_expense_date ON expenses(expense_date);
+
+-- 6. Refresh planner statistics for the rebuilt table and its new indexes
+ANALYZE expenses;
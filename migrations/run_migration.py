@@ -2,23 +2,58 @@
 """
 Migration Script: Remove is_reimbursed from expenses table
 Usage: python migrations/run_migration.py
+
+Standalone fallback for databases that are not managed by Alembic.
+With Alembic, `alembic upgrade head` applies the same change
+(revision 006_remove_is_reimbursed).
 """
 import sqlite3
 import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from dotenv import load_dotenv
+
+# Same default as app.config.Settings.database_url (the app stack is not imported here)
+DEFAULT_DATABASE_URL = "sqlite:///./freizeit_kassen.db"
+
+
+def iter_statements(sql):
+    """Split a SQL script into single statements (comments and quotes aware)"""
+    statement = ""
+    for line in sql.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+    # Trailing statement without semicolon (a comment-only remainder is skipped)
+    if any(line.strip() and not line.strip().startswith('--') for line in statement.splitlines()):
+        yield statement.strip()
 
-from app.config import settings
+
+def backup_database(db_path, backup_path):
+    """Consistent copy of the database via SQLite's online backup API"""
+    # Replace an old backup completely instead of writing into it
+    if os.path.exists(backup_path):
+        os.remove(backup_path)
+
+    src = sqlite3.connect(db_path)
+    dst = sqlite3.connect(backup_path)
+    try:
+        # Flush pending WAL frames into the main file first
+        src.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        src.backup(dst, pages=1000)
+    finally:
+        dst.close()
+        src.close()
 
 
 def run_migration():
     """Execute the migration SQL script"""
 
-    # Extract database path from DATABASE_URL
-    db_url = settings.database_url
+    # Extract database path from DATABASE_URL (environment wins over .env, as in app.config)
+    load_dotenv(".env")
+    db_url = os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL)
     if db_url.startswith('sqlite:///'):
         db_path = db_url.replace('sqlite:///', '')
     else:
@@ -29,49 +64,65 @@ def run_migration():
         print(f"Error: Database file not found at {db_path}")
         sys.exit(1)
 
+    # Autocommit mode: transactions are controlled explicitly below
+    conn = sqlite3.connect(db_path, isolation_level=None)
+
+    # Check if is_reimbursed column exists before doing any I/O-heavy work
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA table_info(expenses)")
+    columns = [col[1] for col in cursor.fetchall()]
+
+    if 'is_reimbursed' not in columns:
+        conn.close()
+        print("Migration already applied - is_reimbursed column does not exist")
+        return
+
     # Read migration SQL
     migration_file = Path(__file__).parent / 'remove_is_reimbursed.sql'
     with open(migration_file, 'r') as f:
         migration_sql = f.read()
 
-    # Create backup
+    # Create backup (only when there is actually something to migrate)
     backup_path = f"{db_path}.backup"
     print(f"Creating backup at: {backup_path}")
-    import shutil
-    shutil.copy2(db_path, backup_path)
+    backup_database(db_path, backup_path)
 
     # Execute migration
     print(f"Running migration on: {db_path}")
-    conn = sqlite3.connect(db_path)
 
-    try:
-        # Check if is_reimbursed column exists
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA table_info(expenses)")
-        columns = [col[1] for col in cursor.fetchall()]
+    # Tuning for the rebuild (per connection), original journal mode is restored afterwards
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")  # 128 MB
 
-        if 'is_reimbursed' not in columns:
-            print("Migration already applied - is_reimbursed column does not exist")
-            conn.close()
-            return
+    try:
+        # Take the write lock up front: the migration runs in one transaction.
+        # executescript() would commit implicitly, so statements run one by one.
+        conn.execute("BEGIN IMMEDIATE")
 
         # Execute migration
-        conn.executescript(migration_sql)
-        conn.commit()
+        for statement in iter_statements(migration_sql):
+            cursor.execute(statement)
+        conn.execute("COMMIT")
         print("Migration completed successfully!")
         print(f"Backup saved at: {backup_path}")
 
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
         print(f"Error during migration: {e}")
         print(f"Database has been rolled back")
         print(f"Backup is available at: {backup_path}")
         sys.exit(1)
 
     finally:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
         conn.close()
 
-
 if __name__ == '__main__':
     print("=" * 60)
     print("Migration: Remove is_reimbursed column from expenses table")
@@ -15,20 +15,22 @@ down_revision = '004_phase3_improvements'
 branch_labels = None
 depends_on = None
 
+DEFAULT_GITHUB_REPO = "https://github.com/ptC7H12/MGBFreizeitplaner/tree/main/rulesets/valid/"
+
 
 def upgrade() -> None:
     """
     Set default GitHub repository URL for existing settings that don't have one
     """
-    default_url = "https://github.com/ptC7H12/MGBFreizeitplaner/tree/main/rulesets/valid/"
-
     # Update all existing settings where default_github_repo is NULL or empty
     op.execute(
-        f"""
-        UPDATE settings
-        SET default_github_repo = '{default_url}'
-        WHERE default_github_repo IS NULL OR default_github_repo = ''
-        """
+        sa.text(
+            """
+            UPDATE settings
+            SET default_github_repo = :url
+            WHERE default_github_repo IS NULL OR default_github_repo = ''
+            """
+        ).bindparams(url=DEFAULT_GITHUB_REPO)
     )
 
 
@@ -36,13 +38,13 @@ def downgrade() -> None:
     """
     Revert default GitHub repository URL to NULL
     """
-    default_url = "https://github.com/ptC7H12/MGBFreizeitplaner/tree/main/rulesets/valid/"
-
     # Set back to NULL for settings that have the default value
     op.execute(
-        f"""
-        UPDATE settings
-        SET default_github_repo = NULL
-        WHERE default_github_repo = '{default_url}'
-        """
+        sa.text(
+            """
+            UPDATE settings
+            SET default_github_repo = NULL
+            WHERE default_github_repo = :url
+            """
+        ).bindparams(url=DEFAULT_GITHUB_REPO)
     )
@@ -7,7 +7,6 @@ Create Date: 2025-11-17 12:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
-from datetime import datetime
 
 
 # revision identifiers, used by Alembic.
@@ -27,14 +26,23 @@ def upgrade() -> None:
     dialect = bind.dialect.name
 
     # 1. Add timestamps to incomes table
-    current_time = datetime.utcnow()
-
-    # Add created_at column
-    op.add_column('incomes', sa.Column('created_at', sa.DateTime(), nullable=False,
-                                       server_default=sa.text('CURRENT_TIMESTAMP')))
-    # Add updated_at column
-    op.add_column('incomes', sa.Column('updated_at', sa.DateTime(), nullable=False,
-                                       server_default=sa.text('CURRENT_TIMESTAMP')))
+    # Add both columns as nullable without a server default: a plain
+    # ADD COLUMN is a metadata-only change, and SQLite rejects
+    # CURRENT_TIMESTAMP as a default for added columns anyway.
+    op.add_column('incomes', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.add_column('incomes', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    # Backfill existing rows in a single pass
+    op.execute(sa.text(
+        "UPDATE incomes "
+        "SET created_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP "
+        "WHERE created_at IS NULL"
+    ))
+
+    # Now enforce NOT NULL for both columns (one table rebuild on SQLite)
+    with op.batch_alter_table('incomes', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
 
     # 2. Make event_id non-nullable in rulesets table
     # First, ensure all rulesets have an event_id (update any NULL values if they exist)
@@ -47,20 +55,16 @@ def upgrade() -> None:
             batch_op.alter_column('event_id',
                                 existing_type=sa.Integer(),
                                 nullable=False)
-            # Add index if not exists (check first to avoid errors)
-            try:
-                batch_op.create_index('ix_rulesets_event_id', ['event_id'], unique=False)
-            except:
-                pass  # Index might already exist
     else:
         # PostgreSQL and other databases
         op.alter_column('rulesets', 'event_id',
                        existing_type=sa.Integer(),
                        nullable=False)
-        try:
-            op.create_index('ix_rulesets_event_id', 'rulesets', ['event_id'], unique=False)
-        except:
-            pass  # Index might already exist
+
+    # Add index if not exists (already created by 001_initial on fresh databases)
+    op.execute(sa.text(
+        "CREATE INDEX IF NOT EXISTS ix_rulesets_event_id ON rulesets (event_id)"
+    ))
 
 
 def downgrade() -> None:
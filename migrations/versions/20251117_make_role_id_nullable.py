@@ -5,6 +5,9 @@ Revises: 001_initial
 Create Date: 2025-11-17 00:00:00.000000
 
 """
+import re
+import sqlite3
+
 from alembic import op
 import sqlalchemy as sa
 
@@ -16,6 +19,52 @@ branch_labels = None
 depends_on = None
 
 
+_ROLE_ID_NOT_NULL = re.compile(r'(\brole_id\s+INTEGER)\s+NOT\s+NULL\b', re.IGNORECASE)
+
+
+def _drop_not_null_in_schema(bind) -> bool:
+    """Remove NOT NULL from participants.role_id by editing sqlite_master
+
+    Dropping a NOT NULL constraint doesn't change the on-disk format, so
+    SQLite allows it to be done directly in the schema (see "Making Other
+    Kinds Of Table Schema Changes" in the SQLite ALTER TABLE docs) - no
+    table copy, no index rebuild. Returns False if the column definition
+    doesn't look as expected or the SQLite build refuses schema writes
+    (SQLITE_DBCONFIG_DEFENSIVE); the caller then falls back to batch mode.
+    """
+    table_sql = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='participants'"
+    ).scalar()
+    if not table_sql:
+        return False
+
+    new_sql, count = _ROLE_ID_NOT_NULL.subn(r'\1', table_sql)
+    if count != 1:
+        return False
+
+    schema_version = bind.exec_driver_sql("PRAGMA schema_version").scalar()
+    try:
+        bind.exec_driver_sql("PRAGMA writable_schema=ON")
+        bind.exec_driver_sql(
+            "UPDATE sqlite_master SET sql = ? WHERE type='table' AND name='participants'",
+            (new_sql,)
+        )
+        # Other connections must reload the schema
+        bind.exec_driver_sql(f"PRAGMA schema_version={schema_version + 1}")
+    except (sqlite3.DatabaseError, sa.exc.DBAPIError):
+        # Defensive mode: sqlite_master is read-only, use the table rebuild instead
+        return False
+    finally:
+        bind.exec_driver_sql("PRAGMA writable_schema=OFF")
+
+    # Re-read the schema and make sure the change took effect
+    columns = bind.exec_driver_sql("PRAGMA table_info(participants)").fetchall()
+    role_id = next(col for col in columns if col[1] == 'role_id')
+    if role_id[3]:
+        raise RuntimeError("participants.role_id is still NOT NULL after schema update")
+    return True
+
+
 def upgrade() -> None:
     """Make role_id nullable in participants table"""
 
@@ -27,12 +76,14 @@ def upgrade() -> None:
     dialect = bind.dialect.name
 
     if dialect == 'sqlite':
-        # SQLite workaround: Can't modify column constraints easily
-        # Instead, we'll use batch mode which recreates the table
-        with op.batch_alter_table('participants', schema=None) as batch_op:
-            batch_op.alter_column('role_id',
-                                existing_type=sa.Integer(),
-                                nullable=True)
+        # Fast path: drop the constraint in the schema only (O(1), no table copy)
+        if not _drop_not_null_in_schema(bind):
+            # SQLite workaround: Can't modify column constraints easily
+            # Instead, we'll use batch mode which recreates the table
+            with op.batch_alter_table('participants', schema=None) as batch_op:
+                batch_op.alter_column('role_id',
+                                    existing_type=sa.Integer(),
+                                    nullable=True)
     else:
         # PostgreSQL and other databases
         op.alter_column('participants', 'role_id',
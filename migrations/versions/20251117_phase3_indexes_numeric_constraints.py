@@ -15,6 +15,13 @@ down_revision = '003_income_timestamps_ruleset_event_id'
 branch_labels = None
 depends_on = None
 
+# event_id indexes added by this revision (created CONCURRENTLY on PostgreSQL)
+_EVENT_ID_INDEXES = [
+    ('ix_expenses_event_id', 'expenses'),
+    ('ix_payments_event_id', 'payments'),
+    ('ix_tasks_event_id', 'tasks'),
+]
+
 
 def upgrade() -> None:
     """
@@ -22,6 +29,8 @@ def upgrade() -> None:
     1. Add indexes to event_id in expense, payment, task tables
     2. Convert Float to Numeric(10, 2) for money fields
     3. Add unique constraint to settings.event_id
+       (redundant with the unique index ix_settings_event_id, removed again
+       in 008_drop_settings_unique_dup)
     """
 
     bind = op.get_bind()
@@ -80,9 +89,12 @@ def upgrade() -> None:
         # PostgreSQL and other databases
 
         # 1. Add indexes
-        op.create_index('ix_expenses_event_id', 'expenses', ['event_id'], unique=False)
-        op.create_index('ix_payments_event_id', 'payments', ['event_id'], unique=False)
-        op.create_index('ix_tasks_event_id', 'tasks', ['event_id'], unique=False)
+        # CREATE INDEX CONCURRENTLY does not block writers, but cannot run
+        # inside a transaction block
+        with op.get_context().autocommit_block():
+            for index_name, table_name in _EVENT_ID_INDEXES:
+                op.create_index(index_name, table_name, ['event_id'], unique=False,
+                                postgresql_concurrently=True, if_not_exists=True)
 
         # 2. Convert Float to Numeric
         op.alter_column('expenses', 'amount',
@@ -174,9 +186,10 @@ def downgrade() -> None:
         # PostgreSQL and other databases
         op.drop_constraint('uq_settings_event_id', 'settings', type_='unique')
 
-        op.drop_index('ix_tasks_event_id', table_name='tasks')
-        op.drop_index('ix_payments_event_id', table_name='payments')
-        op.drop_index('ix_expenses_event_id', table_name='expenses')
+        with op.get_context().autocommit_block():
+            for index_name, table_name in reversed(_EVENT_ID_INDEXES):
+                op.drop_index(index_name, table_name=table_name,
+                              postgresql_concurrently=True, if_exists=True)
 
         op.alter_column('participants', 'discount_percent',
                        existing_type=sa.Numeric(5, 2),
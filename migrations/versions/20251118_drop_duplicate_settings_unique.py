@@ -0,0 +1,66 @@
+"""Drop the duplicate uq_settings_event_id constraint
+
+Revision ID: 008_drop_settings_unique_dup
+Revises: 007_event_date_indexes
+Create Date: 2025-11-18 14:00:00.000000
+
+settings.event_id is already unique through the unique index
+ix_settings_event_id (001_initial, matches `unique=True, index=True` in the
+Setting model). 004_phase3_improvements added uq_settings_event_id on the
+same column, i.e. a second unique B-tree that every insert has to maintain.
+Do not re-add a unique constraint on settings.event_id in future migrations.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_drop_settings_unique_dup'
+down_revision = '007_event_date_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _has_unique_index(inspector) -> bool:
+    return any(
+        index['name'] == 'ix_settings_event_id' and index['unique']
+        for index in inspector.get_indexes('settings')
+    )
+
+
+def upgrade() -> None:
+    """
+    Drop uq_settings_event_id if ix_settings_event_id already enforces uniqueness
+    """
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    inspector = sa.inspect(bind)
+
+    constraints = [uc['name'] for uc in inspector.get_unique_constraints('settings')]
+    if 'uq_settings_event_id' not in constraints or not _has_unique_index(inspector):
+        return
+
+    if dialect == 'sqlite':
+        with op.batch_alter_table('settings', schema=None) as batch_op:
+            batch_op.drop_constraint('uq_settings_event_id', type_='unique')
+    else:
+        op.drop_constraint('uq_settings_event_id', 'settings', type_='unique')
+
+
+def downgrade() -> None:
+    """
+    Re-create uq_settings_event_id (state after 004_phase3_improvements)
+    """
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    constraints = [uc['name'] for uc in sa.inspect(bind).get_unique_constraints('settings')]
+    if 'uq_settings_event_id' in constraints:
+        return
+
+    if dialect == 'sqlite':
+        with op.batch_alter_table('settings', schema=None) as batch_op:
+            batch_op.create_unique_constraint('uq_settings_event_id', ['event_id'])
+    else:
+        op.create_unique_constraint('uq_settings_event_id', 'settings', ['event_id'])
@@ -0,0 +1,40 @@
+"""Add composite (event_id, date) indexes for the list views
+
+Revision ID: 007_event_date_indexes
+Revises: 006_remove_is_reimbursed
+Create Date: 2025-11-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007_event_date_indexes'
+down_revision = '006_remove_is_reimbursed'
+branch_labels = None
+depends_on = None
+
+# The payment, expense and income lists filter on event_id and sort by date.
+# A composite index serves both, so the query needs no temporary sort B-tree.
+_EVENT_DATE_INDEXES = [
+    ('ix_payments_event_id_payment_date', 'payments', 'payment_date'),
+    ('ix_expenses_event_id_expense_date', 'expenses', 'expense_date'),
+    ('ix_incomes_event_id_date', 'incomes', 'date'),
+]
+
+
+def upgrade() -> None:
+    """
+    Add (event_id, <date>) indexes to payments, expenses and incomes
+    """
+    for index_name, table_name, date_column in _EVENT_DATE_INDEXES:
+        op.create_index(index_name, table_name, ['event_id', date_column],
+                        unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """
+    Remove the composite indexes
+    """
+    for index_name, table_name, _ in reversed(_EVENT_DATE_INDEXES):
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
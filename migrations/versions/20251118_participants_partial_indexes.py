@@ -0,0 +1,48 @@
+"""Replace participants flag indexes with partial indexes
+
+Revision ID: 009_participants_partial_idx
+Revises: 008_drop_settings_unique_dup
+Create Date: 2025-11-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_participants_partial_idx'
+down_revision = '008_drop_settings_unique_dup'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop the single-column indexes on the low-cardinality is_active /
+    deleted_at flags and index only the rows the app actually filters for
+    (same indexes as declared in the Participant model)
+    """
+    op.drop_index('ix_participants_is_active', table_name='participants', if_exists=True)
+    op.drop_index('ix_participants_deleted_at', table_name='participants', if_exists=True)
+
+    op.create_index('ix_participants_active', 'participants', ['event_id'], unique=False,
+                    if_not_exists=True,
+                    sqlite_where=sa.text('is_active = 1'),
+                    postgresql_where=sa.text('is_active = true'))
+    op.create_index('ix_participants_live', 'participants', ['event_id', 'last_name'], unique=False,
+                    if_not_exists=True,
+                    sqlite_where=sa.text('deleted_at IS NULL'),
+                    postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade() -> None:
+    """
+    Restore the single-column indexes from 001_initial
+    """
+    op.drop_index('ix_participants_live', table_name='participants', if_exists=True)
+    op.drop_index('ix_participants_active', table_name='participants', if_exists=True)
+
+    op.create_index('ix_participants_deleted_at', 'participants', ['deleted_at'], unique=False,
+                    if_not_exists=True)
+    op.create_index('ix_participants_is_active', 'participants', ['is_active'], unique=False,
+                    if_not_exists=True)
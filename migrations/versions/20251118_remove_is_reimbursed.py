@@ -0,0 +1,54 @@
+"""Remove legacy is_reimbursed column from expenses
+
+Revision ID: 006_remove_is_reimbursed
+Revises: 005_default_github_repo
+Create Date: 2025-11-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_remove_is_reimbursed'
+down_revision = '005_default_github_repo'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Alembic version of migrations/run_migration.py (remove_is_reimbursed.sql):
+    fold is_reimbursed into is_settled and drop the column.
+
+    Databases created from 001_initial never had the column, so this is a
+    no-op unless an old pre-Alembic database was stamped and upgraded.
+    """
+    bind = op.get_bind()
+    columns = [col['name'] for col in sa.inspect(bind).get_columns('expenses')]
+    if 'is_reimbursed' not in columns:
+        return
+
+    # If is_reimbursed was true, keep is_settled as true
+    # (boolean literals render per dialect: 1 on SQLite, true on PostgreSQL)
+    expenses = sa.table(
+        'expenses',
+        sa.column('is_settled', sa.Boolean()),
+        sa.column('is_reimbursed', sa.Boolean()),
+    )
+    op.execute(
+        sa.update(expenses)
+        .where(expenses.c.is_reimbursed == sa.true())
+        .values(is_settled=sa.true())
+    )
+
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.drop_column('is_reimbursed')
+
+
+def downgrade() -> None:
+    """
+    Nothing to revert: is_reimbursed is not part of the schema created by
+    001_initial, and its information now lives in is_settled.
+    """
+    pass
@@ -15,24 +15,20 @@ DEFAULT_GITHUB_REPO = "https://github.com/ptC7H12/MGBFreizeitplaner/tree/main/ru
 def main():
     db = SessionLocal()
     try:
-        # Find all settings with NULL or empty default_github_repo
-        settings = db.query(Setting).filter(
+        # Update all settings with NULL or empty default_github_repo in a single UPDATE
+        updated_count = db.query(Setting).filter(
             (Setting.default_github_repo == None) | (Setting.default_github_repo == '')
-        ).all()
+        ).update(
+            {Setting.default_github_repo: DEFAULT_GITHUB_REPO},
+            synchronize_session=False
+        )
 
-        if not settings:
+        if not updated_count:
             print("✓ All settings already have default_github_repo configured")
             return
 
-        print(f"Found {len(settings)} settings without default_github_repo")
-
-        # Update each setting
-        for setting in settings:
-            setting.default_github_repo = DEFAULT_GITHUB_REPO
-            print(f"  Updated setting for event_id={setting.event_id}")
-
         db.commit()
-        print(f"\n✓ Successfully updated {len(settings)} settings")
+        print(f"\n✓ Successfully updated {updated_count} settings")
 
     except Exception as e:
         db.rollback()
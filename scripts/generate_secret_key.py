@@ -3,12 +3,20 @@
 Helper-Script zum Generieren eines sicheren Secret Keys für die Session-Verschlüsselung.
 
 Verwendung:
-    python generate_secret_key.py
+    python generate_secret_key.py                 # interaktiv
+    python generate_secret_key.py --update-env    # ohne Rückfrage in .env schreiben
+    python generate_secret_key.py --stdout --count 3
 
 Das Script generiert einen neuen Secret Key und zeigt Anweisungen zur Verwendung.
+Mit --stdout werden nur die Keys ausgegeben (eine Zeile pro Key), die .env wird
+dabei nicht angefasst - praktisch für Skripte und CI.
 """
+import argparse
 import secrets
 import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 
 
@@ -24,53 +32,91 @@ def update_env_file(secret_key: str):
 
     # Wenn .env nicht existiert, von .env.example kopieren
     if not env_file.exists() and env_example_file.exists():
-        print(f"📄 Erstelle .env aus .env.example...")
+        print("📄 Erstelle .env aus .env.example...")
         env_file.write_text(env_example_file.read_text())
 
     if env_file.exists():
-        # .env Datei lesen
-        lines = env_file.read_text().splitlines()
-
-        # Prüfen ob SECRET_KEY bereits existiert
-        secret_key_found = False
-        new_lines = []
-
-        for line in lines:
-            if line.startswith("SECRET_KEY="):
-                # Bestehenden Key ersetzen
-                new_lines.append(f"SECRET_KEY={secret_key}")
-                secret_key_found = True
-                print(f"✅ SECRET_KEY in .env aktualisiert")
-            else:
-                new_lines.append(line)
-
-        # Wenn SECRET_KEY nicht gefunden, am Ende hinzufügen
-        if not secret_key_found:
-            # Prüfen ob Security-Sektion existiert
-            if any("# Security" in line for line in new_lines):
-                # Nach Security-Kommentar einfügen
-                insert_idx = next(i for i, line in enumerate(new_lines) if "# Security" in line)
-                # Überspringe Kommentarzeilen
-                while insert_idx < len(new_lines) and (new_lines[insert_idx].startswith("#") or not new_lines[insert_idx].strip()):
-                    insert_idx += 1
-                new_lines.insert(insert_idx, f"SECRET_KEY={secret_key}")
-            else:
-                # Am Ende hinzufügen
-                new_lines.append("")
-                new_lines.append("# Security")
-                new_lines.append(f"SECRET_KEY={secret_key}")
-
-            print(f"✅ SECRET_KEY zu .env hinzugefügt")
-
-        # .env Datei speichern
-        env_file.write_text("\n".join(new_lines) + "\n")
+        # .env zeilenweise in eine temporäre Datei umschreiben und diese dann
+        # atomar über die alte legen - keine halb geschriebene .env bei Abbruch
+        key_line = f"SECRET_KEY={secret_key}\n"
+        key_written = False
+        in_security = False
+
+        with open(env_file) as src, tempfile.NamedTemporaryFile(
+            "w", dir=env_file.parent, prefix=".env.", delete=False
+        ) as tmp:
+            try:
+                for line in src:
+                    line = line.rstrip("\r\n")
+
+                    if line.startswith("SECRET_KEY="):
+                        # Bestehenden Key ersetzen (weitere Vorkommen entfallen)
+                        if not key_written:
+                            tmp.write(key_line)
+                            key_written = True
+                            print("✅ SECRET_KEY in .env aktualisiert")
+                        continue
+
+                    # Ohne SECRET_KEY-Zeile: nach den Kommentaren der Security-Sektion einfügen
+                    if in_security and not key_written and line.strip() and not line.startswith("#"):
+                        tmp.write(key_line)
+                        key_written = True
+                        print("✅ SECRET_KEY zu .env hinzugefügt")
+
+                    if "# Security" in line and not key_written:
+                        in_security = True
+
+                    tmp.write(line + "\n")
+
+                if not key_written:
+                    # Am Ende hinzufügen (ggf. mit neuer Security-Sektion)
+                    if not in_security:
+                        tmp.write("\n# Security\n")
+                    tmp.write(key_line)
+                    print("✅ SECRET_KEY zu .env hinzugefügt")
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        # NamedTemporaryFile legt die Datei mit 0600 an - Rechte der .env beibehalten
+        shutil.copymode(env_file, tmp.name)
+        os.replace(tmp.name, env_file)
         return True
     else:
-        print(f"⚠️  .env Datei nicht gefunden. Bitte manuell erstellen.")
+        print("⚠️  .env Datei nicht gefunden. Bitte manuell erstellen.")
         return False
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generiert Secret Keys für die Session-Verschlüsselung")
+    parser.add_argument("--stdout", action="store_true",
+                        help="Nur die Key(s) ausgeben, .env nicht lesen oder schreiben")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Anzahl der Keys (nur mit --stdout)")
+    parser.add_argument("--update-env", action="store_true",
+                        help="Key ohne Rückfrage in .env speichern")
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count muss mindestens 1 sein")
+    if args.count > 1 and not args.stdout:
+        parser.error("--count ist nur zusammen mit --stdout möglich")
+    return args
+
+
 def main():
+    args = parse_args()
+
+    if args.stdout:
+        print("\n".join(generate_secret_key() for _ in range(args.count)))
+        return
+
+    if args.update_env:
+        if update_env_file(generate_secret_key()):
+            print("⚠️  Bitte starte die Anwendung neu, damit die Änderung wirksam wird.")
+            return
+        sys.exit(1)
+
     print("=" * 80)
     print("🔐 Secret Key Generator für Freizeit-Kassen-System")
     print("=" * 80)
@@ -79,7 +125,7 @@ def main():
     # Secret Key generieren
     secret_key = generate_secret_key()
 
-    print(f"✨ Neuer Secret Key generiert:")
+    print("✨ Neuer Secret Key generiert:")
     print(f"   {secret_key}")
     print()
 
@@ -11,9 +11,25 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
+
 from app.database import Base, engine
 from app.models import *  # Alle Models importieren
 
+
+def build_sqlite_reset_script() -> str:
+    """
+    Erzeugt das komplette DROP/CREATE-DDL als ein SQL-Skript (eine Transaktion).
+    Entspricht drop_all() + create_all(), aber ohne Reflection-Abfragen pro Tabelle.
+    """
+    tables = Base.metadata.sorted_tables
+    statements = [str(DropTable(table, if_exists=True).compile(engine)) for table in reversed(tables)]
+    for table in tables:
+        statements.append(str(CreateTable(table).compile(engine)))
+        statements.extend(str(CreateIndex(index).compile(engine)) for index in table.indexes)
+    return "BEGIN;\n" + ";\n".join(stmt.strip() for stmt in statements) + ";\nCOMMIT;\n"
+
+
 def reset_database():
     """Löscht und erstellt die Datenbank neu"""
     print("=" * 60)
@@ -32,13 +48,24 @@ def reset_database():
         sys.exit(0)
 
     print()
-    print("Lösche alte Tabellen...")
-    Base.metadata.drop_all(bind=engine)
-    print("✓ Alte Tabellen gelöscht")
+    if engine.dialect.name == "sqlite":
+        # SQLite: alle DDL-Statements in einem executescript()-Aufruf
+        print("Lösche alte Tabellen und erstelle neue Tabellen...")
+        raw_connection = engine.raw_connection()
+        try:
+            raw_connection.driver_connection.executescript(build_sqlite_reset_script())
+        finally:
+            raw_connection.close()
+        print("✓ Alte Tabellen gelöscht")
+        print("✓ Neue Tabellen erstellt")
+    else:
+        print("Lösche alte Tabellen...")
+        Base.metadata.drop_all(bind=engine)
+        print("✓ Alte Tabellen gelöscht")
 
-    print("Erstelle neue Tabellen...")
-    Base.metadata.create_all(bind=engine)
-    print("✓ Neue Tabellen erstellt")
+        print("Erstelle neue Tabellen...")
+        Base.metadata.create_all(bind=engine)
+        print("✓ Neue Tabellen erstellt")
 
     print()
     print("=" * 60)
@@ -0,0 +1,60 @@
+"""Tests für die Downloads in build_portable_embedded (komprimierende Server)"""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import build_portable_embedded as build
+
+
+# Gut komprimierbar: die gzip-Antwort ist deutlich kleiner als die Datei
+PAYLOAD = b"MGBFreizeitplaner " * 5000
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Liefert PAYLOAD gzip-kodiert, sofern der Client gzip akzeptiert
+    (bzw. immer, wenn der Server 'always_gzip' gesetzt hat)"""
+
+    def do_GET(self):
+        accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        if accepts_gzip or self.server.always_gzip:
+            body = gzip.compress(PAYLOAD)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(params=[False, True], ids=["negotiating", "always_gzip"])
+def gzip_server(request):
+    """Lokaler HTTP-Server, der Antworten gzip-komprimiert"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    server.always_gzip = request.param
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/python.tar.gz"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_download_requests_identity_encoding():
+    """Downloads fordern unkomprimierte Übertragung an"""
+    assert build.DOWNLOAD_HEADERS["Accept-Encoding"] == "identity"
+
+
+def test_download_from_gzip_server(gzip_server, tmp_path):
+    """Vollständiger Download trotz Content-Encoding: gzip"""
+    destination = tmp_path / "python.tar.gz"
+
+    assert build.download_file(gzip_server, destination, "Testdatei") is True
+    assert destination.read_bytes() == PAYLOAD